@@ -0,0 +1,143 @@
+import argparse
+import collections
+import importlib
+import sys
+from pathlib import Path
+from typing import Counter, Dict, Generator, List, NamedTuple, Optional, Tuple
+
+from python.util import (
+    Input,
+    Solution,
+    format_answer,
+    load_input,
+    resolve_input_path,
+    takes_input_stream,
+    timed_solution,
+)
+
+
+DAYS = list(range(1, 26))
+PARTS = [1, 2]
+
+
+class Job(NamedTuple):
+    day: int
+    part: int
+    input: str
+
+    def __str__(self) -> str:
+        return f"day{self.day} {self.input}"
+
+
+class JobResult(NamedTuple):
+    job: Job
+    answer: Optional[int]
+    elapsed_time: float
+    error: Optional[str]
+
+
+def parse_job(spec: str) -> Job:
+    """Return the job described by the specified 'spec', of the form
+    'DAY:PART:INPUT', where 'INPUT' is either one of 'INPUT_TYPES' or a path to
+    an input file."""
+
+    tokens = spec.split(":", 2)
+    assert len(tokens) == 3, f"Expected 'DAY:PART:INPUT', got '{spec}'"
+
+    day, part, input = tokens
+    assert int(part) in PARTS, f"Part ({part}) must be one of {PARTS}"
+
+    return Job(day=int(day), part=int(part), input=input)
+
+
+def load_solution(day: int, part: int) -> Solution:
+    """..."""
+
+    module = importlib.import_module(f"python.day{day}")
+    return module.part1 if part == 1 else module.part2
+
+
+def run_jobs(jobs: List[Job]) -> Generator[JobResult, None, None]:
+    """Run the specified 'jobs' in order, in this process, and yield the result
+    of each job as it completes.  Each input file is read at most once, and is
+    released as soon as the last job that needs it has run."""
+
+    paths = [resolve_input_path(job.day, job.input) for job in jobs]
+
+    pending_uses: Counter[Path] = collections.Counter(paths)
+
+    # Inputs are keyed by path and by whether they were loaded as a stream.
+    inputs: Dict[Tuple[Path, bool], Input] = {}
+
+    for job, path in zip(jobs, paths):
+        try:
+            solution = load_solution(job.day, job.part)
+
+            key = (path, takes_input_stream(solution))
+            if key not in inputs:
+                inputs[key] = load_input(solution, path)
+
+            answer, elapsed_time = timed_solution(solution, inputs[key])
+            yield JobResult(
+                job=job, answer=answer, elapsed_time=elapsed_time, error=None
+            )
+
+        except Exception as error:
+            yield JobResult(
+                job=job,
+                answer=None,
+                elapsed_time=0.0,
+                error=f"{type(error).__name__}: {error}",
+            )
+
+        pending_uses[path] -= 1
+        if pending_uses[path] == 0:
+            inputs.pop((path, False), None)
+            inputs.pop((path, True), None)
+
+
+def format_job_result(result: JobResult) -> str:
+    """..."""
+
+    if result.error is not None:
+        return f"{result.job}: Part {result.job.part} failed: {result.error}"
+
+    return f"{result.job}: " + format_answer(
+        result.job.part, result.answer, result.elapsed_time
+    )
+
+
+def parse_args(args: List[str]) -> argparse.Namespace:
+    """..."""
+
+    parser = argparse.ArgumentParser(prog="python -m python.batch")
+    parser.add_argument("jobs", type=parse_job, nargs="*", metavar="DAY:PART:INPUT")
+    parser.add_argument("--days", type=int, nargs="+", default=DAYS)
+    parser.add_argument("--parts", type=int, nargs="+", choices=PARTS, default=PARTS)
+    parser.add_argument("--inputs", type=str, nargs="+", default=["test"])
+
+    return parser.parse_args(args)
+
+
+def main(args: List[str]) -> int:
+    """..."""
+
+    parsed_args = parse_args(args)
+
+    jobs = parsed_args.jobs or [
+        Job(day=day, part=part, input=input)
+        for day in parsed_args.days
+        for input in parsed_args.inputs
+        for part in parsed_args.parts
+    ]
+
+    num_failures = 0
+    for result in run_jobs(jobs):
+        print(format_job_result(result), flush=True)
+        num_failures += result.error is not None
+
+    return 1 if num_failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
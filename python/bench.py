@@ -0,0 +1,563 @@
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import statistics
+import sys
+import time
+import timeit
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from python.gen import generate
+from python.util import (
+    INPUT_TYPES,
+    Input,
+    Solution,
+    load_input,
+    resolve_input_path,
+)
+
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "bench_baseline.json"
+
+# Days whose solutions take minutes per run, which are only benchmarked when
+# requested with '--days'.
+SLOW_DAYS = [19, 23]
+
+DAYS = [day for day in range(1, 26) if day not in SLOW_DAYS]
+PARTS = [1, 2]
+INPUTS = list(INPUT_TYPES)
+
+
+class BenchmarkResult(NamedTuple):
+    day: int
+    part: int
+    input: str
+    answer: Optional[str]
+    error: Optional[str]
+    repeat: int
+    min: Optional[float]
+    median: Optional[float]
+    p95: Optional[float]
+    peak_memory: Optional[int]
+
+    @property
+    def key(self) -> str:
+        """..."""
+
+        return benchmark_key(self.day, self.part, self.input)
+
+
+class Regression(NamedTuple):
+    key: str
+    reason: str
+
+
+# Set up the variants of a micro-benchmark on a generated input: return a
+# zero-argument callable per variant, each of which computes the same result.
+MicroBenchmarkSetup = Callable[[str], Dict[str, Callable[[], object]]]
+
+
+class MicroBenchmark(NamedTuple):
+    day: int
+    size: int
+    setup: MicroBenchmarkSetup
+
+
+class MicroBenchmarkResult(NamedTuple):
+    name: str
+    variant: str
+    result: object
+    min: float
+    median: float
+
+
+MICRO_BENCHMARKS: Dict[str, MicroBenchmark] = {}
+
+
+def micro_benchmark(
+    name: str, *, day: int, size: int
+) -> Callable[[MicroBenchmarkSetup], MicroBenchmarkSetup]:
+    """Register the decorated setup function as the micro-benchmark with the
+    specified 'name', run by default on an input of the specified 'size'
+    generated for the specified 'day'."""
+
+    def register(setup: MicroBenchmarkSetup) -> MicroBenchmarkSetup:
+        MICRO_BENCHMARKS[name] = MicroBenchmark(day=day, size=size, setup=setup)
+        return setup
+
+    return register
+
+
+@micro_benchmark("day1.count_increments", day=1, size=1000000)
+def day1_count_increments(input: str) -> Dict[str, Callable[[], object]]:
+    """..."""
+
+    day1 = importlib.import_module("python.day1")
+    measurements = day1.parse_measurement_array(input)
+
+    return {
+        "deque": lambda: day1.count_increments(iter(measurements), window_size=3),
+        "bulk": lambda: day1.count_increments_in_bulk(measurements, window_size=3),
+    }
+
+
+@micro_benchmark("day1.multiple_windows", day=1, size=1000000)
+def day1_multiple_windows(input: str) -> Dict[str, Callable[[], object]]:
+    """..."""
+
+    day1 = importlib.import_module("python.day1")
+    window_sizes = [1, 3, 7, 30, 365]
+
+    return {
+        "per_window": lambda: {
+            window_size: day1.count_increments(
+                day1.parse_measurements(input), window_size=window_size
+            )
+            for window_size in window_sizes
+        },
+        "batch": lambda: day1.count_increments_for_windows(
+            day1.parse_measurement_array(input), window_sizes
+        ),
+    }
+
+
+@micro_benchmark("day1.part2", day=1, size=1000000)
+def day1_part2(input: str) -> Dict[str, Callable[[], object]]:
+    """..."""
+
+    day1 = importlib.import_module("python.day1")
+
+    return {
+        "deque": lambda: day1.count_increments(
+            map(int, input.splitlines()), window_size=3
+        ),
+        "bulk": lambda: day1.part2(input),
+    }
+
+
+@micro_benchmark("day2.parse", day=2, size=2000000)
+def day2_parse(input: str) -> Dict[str, Callable[[], object]]:
+    """..."""
+
+    day2 = importlib.import_module("python.day2")
+
+    return {
+        "commands": lambda: len(list(day2.parse_commands(input))),
+        "columns": lambda: len(day2.parse_command_columns(input).magnitudes),
+    }
+
+
+@micro_benchmark("day2.evaluate", day=2, size=2000000)
+def day2_evaluate(input: str) -> Dict[str, Callable[[], object]]:
+    """..."""
+
+    day2 = importlib.import_module("python.day2")
+    commands = list(day2.parse_commands(input))
+    columns = day2.parse_command_columns(input)
+
+    return {
+        "transforms": lambda: day2.compose_transforms(
+            map(day2.command_transform, commands)
+        ),
+        "loop": lambda: day2.compose_commands(commands),
+        "columns": lambda: day2.evaluate_command_columns(columns),
+    }
+
+
+@micro_benchmark("day3.power_consumption", day=3, size=1000000)
+def day3_power_consumption(input: str) -> Dict[str, Callable[[], object]]:
+    """..."""
+
+    day3 = importlib.import_module("python.day3")
+
+    return {
+        "characters": lambda: day3.compute_power_consumption(
+            day3.parse_diagnostic_report(input)
+        ),
+        "packed": lambda: day3.compute_packed_power_consumption(
+            day3.parse_packed_report(input)
+        ),
+    }
+
+
+@micro_benchmark("day3.life_support_rating", day=3, size=1000000)
+def day3_life_support_rating(input: str) -> Dict[str, Callable[[], object]]:
+    """..."""
+
+    day3 = importlib.import_module("python.day3")
+    report = day3.parse_packed_report(input)
+    index = day3.build_report_index(report)
+
+    return {
+        "filter": lambda: day3.compute_packed_life_support_rating(report),
+        "index": lambda: day3.compute_indexed_life_support_rating(
+            day3.build_report_index(report)
+        ),
+        "built_index": lambda: day3.compute_indexed_life_support_rating(index),
+    }
+
+
+@micro_benchmark("day4.winning_scores", day=4, size=200)
+def day4_winning_scores(input: str) -> Dict[str, Callable[[], object]]:
+    """..."""
+
+    day4 = importlib.import_module("python.day4")
+    numbers, boards = day4.parse_input(input)
+    _, tensor = day4.parse_board_tensor(input)
+
+    def ranked_scores() -> List[int]:
+        ranking = day4.rank_boards(numbers, tensor)
+        return [ranking.scores[board_idx] for board_idx in ranking.finishing_order]
+
+    return {
+        "rescan": lambda: list(day4.winning_scores_by_rescan(numbers, boards)),
+        "index": lambda: list(day4.winning_scores(numbers, boards)),
+        "rank": ranked_scores,
+    }
+
+
+@micro_benchmark("day5.overlaps", day=5, size=20000)
+def day5_overlaps(input: str) -> Dict[str, Callable[[], object]]:
+    """..."""
+
+    day5 = importlib.import_module("python.day5")
+    vents = day5.parse_vents(input)
+    segments = day5.parse_vent_segments(input)
+
+    return {
+        "sets": lambda: len(day5.find_intersections(vents, ignore_diagonals=False)),
+        "dense": lambda: day5.count_overlaps_dense(segments, ignore_diagonals=False),
+        "sparse": lambda: day5.count_overlaps_sparse(segments, ignore_diagonals=False),
+    }
+
+
+def benchmark_key(day: int, part: int, input: str) -> str:
+    """..."""
+
+    return f"day{day}/part{part}/{input}"
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """Return the nearest-rank percentile, at the specified 'fraction' in
+    '[0, 1]', of the specified non-empty 'samples'."""
+
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, round(fraction * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def time_solution(
+    solution: Solution, input: Input, *, warmup: int, repeat: int
+) -> List[float]:
+    """..."""
+
+    for _ in range(warmup):
+        solution(input)
+
+    timings = []
+    for _ in range(repeat):
+        start_time_in_seconds = time.perf_counter()
+        solution(input)
+        end_time_in_seconds = time.perf_counter()
+        timings.append(end_time_in_seconds - start_time_in_seconds)
+
+    return timings
+
+
+def measure_peak_memory(solution: Solution, input: Input) -> int:
+    """..."""
+
+    tracemalloc.start()
+    try:
+        solution(input)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak
+
+
+def run_benchmark(
+    day: int,
+    part: int,
+    input_type: str,
+    *,
+    warmup: int,
+    repeat: int,
+    trace_memory: bool,
+) -> Optional[BenchmarkResult]:
+    """Return the benchmark result of the specified 'part' of the specified
+    'day' on the specified 'input_type', or 'None' if the input file does not
+    exist."""
+
+    input_path = resolve_input_path(day, input_type)
+    if not input_path.is_file():
+        return None
+
+    module = importlib.import_module(f"python.day{day}")
+    solution = module.part1 if part == 1 else module.part2
+    input = load_input(solution, input_path)
+
+    # Some solutions (e.g. day 13) render their answer to stdout, which is
+    # discarded so that it does not interleave with the benchmark report.
+
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            # The first call doubles as a warmup run.
+            answer = solution(input)
+            timings = time_solution(
+                solution, input, warmup=max(0, warmup - 1), repeat=repeat
+            )
+            peak_memory = measure_peak_memory(solution, input) if trace_memory else None
+    except Exception as error:
+        return BenchmarkResult(
+            day=day,
+            part=part,
+            input=input_type,
+            answer=None,
+            error=f"{type(error).__name__}: {error}",
+            repeat=repeat,
+            min=None,
+            median=None,
+            p95=None,
+            peak_memory=None,
+        )
+
+    return BenchmarkResult(
+        day=day,
+        part=part,
+        input=input_type,
+        answer=str(answer),
+        error=None,
+        repeat=repeat,
+        min=min(timings),
+        median=statistics.median(timings),
+        p95=percentile(timings, 0.95),
+        peak_memory=peak_memory,
+    )
+
+
+def run_micro_benchmark(
+    name: str, *, size: Optional[int], seed: int, warmup: int, repeat: int
+) -> List[MicroBenchmarkResult]:
+    """Return the result of each variant of the micro-benchmark with the
+    specified 'name', on an input of the specified 'size' (or the default size
+    of the benchmark, if 'None') generated from the specified 'seed'."""
+
+    benchmark = MICRO_BENCHMARKS[name]
+    input = generate(benchmark.day, size or benchmark.size, seed=seed)
+
+    results = []
+    for variant, function in benchmark.setup(input).items():
+        for _ in range(warmup):
+            function()
+
+        timings = timeit.repeat(function, number=1, repeat=repeat)
+        results.append(
+            MicroBenchmarkResult(
+                name=name,
+                variant=variant,
+                result=function(),
+                min=min(timings),
+                median=statistics.median(timings),
+            )
+        )
+
+    return results
+
+
+def format_micro_results(results: List[MicroBenchmarkResult]) -> str:
+    """Return the specified 'results' of one micro-benchmark, with the speedup
+    of each variant over the first, and a marker on results that disagree."""
+
+    baseline = results[0]
+
+    return "\n".join(
+        f"{result.name:<24} {result.variant:<12} min={result.min:.4f}s "
+        f"median={result.median:.4f}s speedup={baseline.median / result.median:.1f}x"
+        + ("" if result.result == baseline.result else " (MISMATCH)")
+        for result in results
+    )
+
+
+def load_results(path: Path) -> Dict[str, dict]:
+    """..."""
+
+    return json.loads(path.read_text())["results"]
+
+
+def dump_results(
+    results: List[BenchmarkResult], path: Path, *, merge: bool = False
+) -> None:
+    """Write the specified 'results' as JSON to the specified 'path'.  If
+    'merge' is set, keep the entries already in 'path' that are not part of
+    'results', so that a subset of days can be re-recorded."""
+
+    existing = load_results(path) if merge and path.is_file() else {}
+    existing.update((result.key, result._asdict()) for result in results)
+
+    payload = {"python": sys.version.split()[0], "results": existing}
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n")
+
+
+def find_regressions(
+    results: List[BenchmarkResult],
+    baseline: Dict[str, dict],
+    *,
+    threshold: float,
+    min_delta: float,
+) -> List[Regression]:
+    """Return the regressions of the specified 'results' against the specified
+    'baseline'.  A result regresses if it now fails or returns a different
+    answer, or if its median exceeds the baseline median by more than the
+    specified 'threshold' (as a fraction) *and* by more than the specified
+    'min_delta' seconds, which keeps sub-millisecond noise from failing the
+    comparison.  Results absent from 'baseline' are never regressions."""
+
+    regressions = []
+
+    for result in results:
+        expected = baseline.get(result.key)
+        if expected is None or expected["error"] is not None:
+            continue
+
+        if result.error is not None:
+            regressions.append(Regression(result.key, f"now fails: {result.error}"))
+            continue
+
+        if result.answer != expected["answer"]:
+            regressions.append(
+                Regression(
+                    result.key,
+                    f"answer changed from {expected['answer']} to {result.answer}",
+                )
+            )
+            continue
+
+        delta = result.median - expected["median"]
+        if delta > min_delta and delta > threshold * expected["median"]:
+            regressions.append(
+                Regression(
+                    result.key,
+                    f"median {expected['median']:.4f}s -> {result.median:.4f}s "
+                    f"(+{delta / expected['median']:.0%})",
+                )
+            )
+
+    return regressions
+
+
+def format_result(result: BenchmarkResult) -> str:
+    """..."""
+
+    if result.error is not None:
+        return f"{result.key:<22} ERROR {result.error}"
+
+    peak_memory = (
+        "-" if result.peak_memory is None else f"{result.peak_memory / 2**20:.1f}MiB"
+    )
+    return (
+        f"{result.key:<22} min={result.min:.4f}s median={result.median:.4f}s "
+        f"p95={result.p95:.4f}s peak={peak_memory} answer={result.answer}"
+    )
+
+
+def parse_args(args: List[str]) -> argparse.Namespace:
+    """..."""
+
+    parser = argparse.ArgumentParser(prog="python -m python.bench")
+    parser.add_argument("--days", type=int, nargs="+", default=DAYS)
+    parser.add_argument("--skip-days", type=int, nargs="+", default=[])
+    parser.add_argument("--parts", type=int, nargs="+", choices=PARTS, default=PARTS)
+    parser.add_argument("--inputs", type=str, nargs="+", choices=INPUTS, default=INPUTS)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--no-memory", action="store_true")
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--no-compare", action="store_true")
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    parser.add_argument("--min-delta", type=float, default=0.005)
+    parser.add_argument(
+        "--micro", type=str, nargs="+", choices=sorted(MICRO_BENCHMARKS), default=[]
+    )
+    parser.add_argument("--size", type=int)
+    parser.add_argument("--seed", type=int, default=0)
+
+    parsed_args = parser.parse_args(args)
+    assert parsed_args.repeat > 0, f"Repeat ({parsed_args.repeat}) must be positive"
+
+    return parsed_args
+
+
+def main(args: List[str]) -> int:
+    """..."""
+
+    parsed_args = parse_args(args)
+
+    if parsed_args.micro:
+        num_mismatches = 0
+        for name in parsed_args.micro:
+            micro_results = run_micro_benchmark(
+                name,
+                size=parsed_args.size,
+                seed=parsed_args.seed,
+                warmup=parsed_args.warmup,
+                repeat=parsed_args.repeat,
+            )
+            print(format_micro_results(micro_results), flush=True)
+            num_mismatches += any(
+                result.result != micro_results[0].result for result in micro_results
+            )
+
+        return 1 if num_mismatches else 0
+
+    results: List[BenchmarkResult] = []
+    for day in parsed_args.days:
+        if day in parsed_args.skip_days:
+            continue
+
+        for input_type in parsed_args.inputs:
+            for part in parsed_args.parts:
+                result = run_benchmark(
+                    day,
+                    part,
+                    input_type,
+                    warmup=parsed_args.warmup,
+                    repeat=parsed_args.repeat,
+                    trace_memory=not parsed_args.no_memory,
+                )
+                if result is not None:
+                    print(format_result(result), flush=True)
+                    results.append(result)
+
+    if parsed_args.output is not None:
+        dump_results(results, parsed_args.output)
+
+    if parsed_args.update_baseline:
+        dump_results(results, parsed_args.baseline, merge=True)
+        return 0
+
+    if parsed_args.no_compare or not parsed_args.baseline.is_file():
+        return 0
+
+    regressions = find_regressions(
+        results,
+        load_results(parsed_args.baseline),
+        threshold=parsed_args.threshold,
+        min_delta=parsed_args.min_delta,
+    )
+
+    for regression in regressions:
+        print(f"REGRESSION {regression.key}: {regression.reason}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
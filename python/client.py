@@ -0,0 +1,87 @@
+import argparse
+import json
+import os
+import socket
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+# The client is kept free of any 'python.*' imports, so that a request only
+# pays for the interpreter startup and not for loading the solutions.
+
+DEFAULT_SOCKET = Path(
+    os.environ.get(
+        "AOC_SOLVER_SOCKET",
+        Path(tempfile.gettempdir()) / "advent-of-code-2021.sock",
+    )
+)
+
+
+def request_solution(
+    day: int,
+    part: int,
+    *,
+    input_path: Optional[Path] = None,
+    input_text: Optional[str] = None,
+    socket_path: Path = DEFAULT_SOCKET,
+) -> Dict[str, Any]:
+    """Return the response of the solver daemon listening on the specified
+    'socket_path' to the specified 'part' of the specified 'day', given exactly
+    one of the specified 'input_path' or 'input_text'."""
+
+    assert (input_path is None) != (
+        input_text is None
+    ), "Expected exactly one of 'input_path' or 'input_text'"
+
+    request: Dict[str, Any] = {"day": day, "part": part}
+    if input_path is not None:
+        request["input_path"] = str(Path(input_path).resolve())
+    else:
+        request["input_text"] = input_text
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(str(socket_path))
+        connection.sendall(json.dumps(request).encode() + b"\n")
+
+        with connection.makefile("rb") as response:
+            return json.loads(response.readline())
+
+
+def parse_args(args: List[str]) -> argparse.Namespace:
+    """..."""
+
+    parser = argparse.ArgumentParser(prog="python -m python.client")
+    parser.add_argument("--day", type=int, required=True)
+    parser.add_argument("--part", type=int, choices=[1, 2], required=True)
+    parser.add_argument("--input", type=Path, required=True)
+    parser.add_argument("--socket", type=Path, default=DEFAULT_SOCKET)
+
+    return parser.parse_args(args)
+
+
+def main(args: List[str]) -> int:
+    """..."""
+
+    parsed_args = parse_args(args)
+
+    response = request_solution(
+        parsed_args.day,
+        parsed_args.part,
+        input_path=parsed_args.input,
+        socket_path=parsed_args.socket,
+    )
+
+    if "error" in response:
+        print(response["error"], file=sys.stderr)
+        return 1
+
+    print(response["output"], end="")
+    print(response["line"])
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
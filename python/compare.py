@@ -0,0 +1,309 @@
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+from python.util import resolve_input_path
+
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+# The extension of the solution files of each language, in table order.
+LANGUAGES: Dict[str, str] = {"python": "py", "golang": "go", "typescript": "ts"}
+
+ANSWER_PATTERN = re.compile(r"Part [12]: (?P<answer>.*)$")
+
+
+class Run(NamedTuple):
+    elapsed_time: float
+    max_rss: int
+    exit_code: int
+    output: str
+
+
+class Comparison(NamedTuple):
+    language: str
+    answer: Optional[str]
+    error: Optional[str]
+    timings: List[float]
+    max_rss: Optional[int]
+
+
+def solution_path(language: str, day: int) -> Path:
+    """..."""
+
+    return ROOT_DIR / language / f"day{day}.{LANGUAGES[language]}"
+
+
+def solution_command(
+    language: str, day: int, part: int, input_path: Path, *, build_dir: Path
+) -> List[str]:
+    """Return the command that runs the solution to the specified 'part' of
+    the specified 'day' in the specified 'language' on the specified
+    'input_path'.  Compiled languages are built into the specified
+    'build_dir' up front, so that timed runs measure the solution rather than
+    the compiler (as 'go run' and 'ts-node' would)."""
+
+    source = solution_path(language, day)
+    arguments = ["--input", str(input_path), "--part", str(part)]
+
+    if language == "python":
+        # The answer cache would turn every warm run into a lookup.
+        return [sys.executable, "-m", f"python.day{day}", "--no-cache"] + arguments
+
+    if language == "golang":
+        binary = build_dir / f"day{day}"
+        util = source.parent / "util.go"
+        subprocess.run(
+            ["go", "build", "-o", str(binary), str(source), str(util)],
+            cwd=ROOT_DIR,
+            check=True,
+            capture_output=True,
+        )
+        return [str(binary), "-input", str(input_path), "-part", str(part)]
+
+    if language == "typescript":
+        tsc = ROOT_DIR / "node_modules" / ".bin" / "tsc"
+        assert tsc.is_file(), f"Cannot find {tsc}, run 'npm install' first"
+
+        subprocess.run(
+            [
+                str(tsc),
+                "--outDir",
+                str(build_dir),
+                "--module",
+                "commonjs",
+                "--target",
+                "es2019",
+                "--esModuleInterop",
+                str(source),
+                str(source.parent / "util.ts"),
+            ],
+            cwd=ROOT_DIR,
+            check=True,
+            capture_output=True,
+        )
+        return ["node", str(build_dir / f"day{day}.js")] + arguments
+
+    raise ValueError(f"Unsupported language: {language}")
+
+
+def run_command(command: List[str]) -> Run:
+    """Run the specified 'command' to completion, and return its wall time and
+    the maximum resident set size of its process, as reported by 'wait4'."""
+
+    # Compiled TypeScript resolves its dependencies from the repository.
+    env = dict(os.environ, NODE_PATH=str(ROOT_DIR / "node_modules"))
+
+    start_time_in_seconds = time.perf_counter()
+    process = subprocess.Popen(
+        command,
+        cwd=ROOT_DIR,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+    )
+    output = process.stdout.read()
+    _, status, rusage = os.wait4(process.pid, 0)
+    end_time_in_seconds = time.perf_counter()
+
+    process.stdout.close()
+
+    # The child was reaped by 'wait4', so record its exit code for 'Popen'.
+    process.returncode = os.WEXITSTATUS(status) if os.WIFEXITED(status) else -1
+
+    return Run(
+        elapsed_time=end_time_in_seconds - start_time_in_seconds,
+        # 'ru_maxrss' is in kibibytes on Linux.
+        max_rss=rusage.ru_maxrss * 1024,
+        exit_code=process.returncode,
+        output=output.decode(errors="replace"),
+    )
+
+
+def describe_failure(run: Run) -> str:
+    """..."""
+
+    last_lines = run.output.strip().splitlines()[-1:]
+    return f"exit code {run.exit_code}" + "".join(f": {line}" for line in last_lines)
+
+
+def parse_answer(output: str) -> Optional[str]:
+    """Return the answer from the last 'Part N: ANSWER' line of the specified
+    'output', which every language prints, or 'None' if there is none."""
+
+    answers = [
+        match.group("answer")
+        for match in map(ANSWER_PATTERN.search, output.splitlines())
+        if match is not None
+    ]
+    return answers[-1] if answers else None
+
+
+def compare_language(
+    language: str,
+    day: int,
+    part: int,
+    input_path: Path,
+    *,
+    warmup: int,
+    repeat: int,
+    build_dir: Path,
+) -> Comparison:
+    """..."""
+
+    error = None
+
+    try:
+        command = solution_command(
+            language, day, part, input_path, build_dir=build_dir
+        )
+
+        for _ in range(warmup):
+            run_command(command)
+
+        runs = [run_command(command) for _ in range(repeat)]
+
+    except subprocess.CalledProcessError as build_error:
+        error = f"build failed: {build_error.stderr.decode().strip()}"
+    except (AssertionError, OSError) as run_error:
+        error = f"{type(run_error).__name__}: {run_error}"
+    else:
+        failed_runs = [run for run in runs if run.exit_code != 0]
+        if failed_runs:
+            error = describe_failure(failed_runs[0])
+
+    if error is not None:
+        return Comparison(
+            language=language, answer=None, error=error, timings=[], max_rss=None
+        )
+
+    return Comparison(
+        language=language,
+        answer=parse_answer(runs[-1].output),
+        error=None,
+        timings=[run.elapsed_time for run in runs],
+        max_rss=max(run.max_rss for run in runs),
+    )
+
+
+def measure_rss_floor() -> int:
+    """Return the maximum resident set size that 'run_command' reports for a
+    command that does nothing.  Linux carries the resident set of the forking
+    process over into the 'ru_maxrss' of its child, so a solution whose
+    maximum is at this floor may have used less memory than reported."""
+
+    return run_command(["true"]).max_rss
+
+
+def format_rss(max_rss: int, *, rss_floor: int) -> str:
+    """..."""
+
+    if max_rss <= rss_floor:
+        return f"<={rss_floor / 2**20:.1f}MiB"
+
+    return f"{max_rss / 2**20:.1f}MiB"
+
+
+def format_table(comparisons: List[Comparison], *, rss_floor: int) -> str:
+    """Return the comparisons as a table, with the ratio of each median to
+    the fastest median, and a marker on answers that disagree."""
+
+    medians = {
+        comparison.language: statistics.median(comparison.timings)
+        for comparison in comparisons
+        if comparison.timings
+    }
+    fastest = min(medians.values(), default=None)
+
+    answers = {
+        comparison.answer for comparison in comparisons if comparison.error is None
+    }
+
+    lines = [
+        f"{'language':<12} {'min':>9} {'median':>9} {'vs best':>8} "
+        f"{'max RSS':>12}  answer"
+    ]
+    for comparison in comparisons:
+        if comparison.error is not None:
+            lines.append(f"{comparison.language:<12} ERROR {comparison.error}")
+            continue
+
+        median = medians[comparison.language]
+        lines.append(
+            f"{comparison.language:<12} {min(comparison.timings):>8.4f}s "
+            f"{median:>8.4f}s {median / fastest:>7.1f}x "
+            f"{format_rss(comparison.max_rss, rss_floor=rss_floor):>12}  "
+            f"{comparison.answer}"
+            + ("  (MISMATCH)" if len(answers) > 1 else "")
+        )
+
+    return "\n".join(lines)
+
+
+def parse_args(args: List[str]) -> argparse.Namespace:
+    """..."""
+
+    parser = argparse.ArgumentParser(prog="python -m python.compare")
+    parser.add_argument("--day", type=int, required=True)
+    parser.add_argument("--part", type=int, choices=[1, 2], required=True)
+    parser.add_argument("--input", type=str, required=True)
+    parser.add_argument(
+        "--languages", type=str, nargs="+", choices=list(LANGUAGES), default=None
+    )
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=5)
+
+    parsed_args = parser.parse_args(args)
+    assert parsed_args.repeat > 0, f"Repeat ({parsed_args.repeat}) must be positive"
+
+    return parsed_args
+
+
+def main(args: List[str]) -> int:
+    """..."""
+
+    parsed_args = parse_args(args)
+
+    input_path = resolve_input_path(parsed_args.day, parsed_args.input).resolve()
+    assert input_path.is_file(), f"Cannot find input file: {input_path}"
+
+    languages = [
+        language
+        for language in parsed_args.languages or LANGUAGES
+        if solution_path(language, parsed_args.day).is_file()
+    ]
+    assert languages, f"No language has a solution for day {parsed_args.day}"
+
+    print(
+        f"day{parsed_args.day} part {parsed_args.part} on {input_path} "
+        f"({parsed_args.repeat} runs after {parsed_args.warmup} warmup)"
+    )
+
+    with tempfile.TemporaryDirectory() as build_dir:
+        comparisons = [
+            compare_language(
+                language,
+                parsed_args.day,
+                parsed_args.part,
+                input_path,
+                warmup=parsed_args.warmup,
+                repeat=parsed_args.repeat,
+                build_dir=Path(build_dir),
+            )
+            for language in languages
+        ]
+
+    print(format_table(comparisons, rss_floor=measure_rss_floor()))
+
+    return 1 if any(comparison.error is not None for comparison in comparisons) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,393 @@
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import math
+import statistics
+import sys
+from pathlib import Path
+from typing import Dict, Generator, List, NamedTuple, Optional, Tuple
+
+from python.bench import measure_peak_memory, time_solution
+from python.gen import generate
+
+
+PARTS = [1, 2]
+
+# Timings under a millisecond are dominated by noise, so are left out of fits.
+MIN_MEASURABLE_TIME = 1e-3
+
+
+class Expectation(NamedTuple):
+    """The expected exponents of runtime and peak memory against the 'size'
+    of 'python.gen' for one part of one day.  'None' means that the part is
+    not profiled, e.g. because the generator ignores 'size'."""
+
+    time: Optional[float]
+    memory: Optional[float]
+
+
+# The first size of the geometric series of each day, chosen so that it runs
+# in milliseconds.
+BASE_SIZES: Dict[int, int] = {
+    1: 10000,
+    2: 10000,
+    3: 1000,
+    4: 100,
+    5: 500,
+    6: 10000,
+    7: 200,
+    8: 1000,
+    9: 25,
+    10: 1000,
+    11: 10,
+    12: 4,
+    13: 1000,
+    14: 100,
+    15: 10,
+    16: 100,
+    17: 20,
+    18: 20,
+    19: 2,
+    20: 10,
+    21: 1,
+    22: 50,
+    23: 1,
+    24: 7,
+    25: 20,
+}
+
+# What a solution *should* scale as, in terms of each generator's 'size' (so
+# grid days, whose 'size' is a side, expect at least 2).  Solutions that scale
+# worse than this are flagged.
+EXPECTATIONS: Dict[Tuple[int, int], Expectation] = {
+    (1, 1): Expectation(time=1, memory=1),
+    (1, 2): Expectation(time=1, memory=1),
+    (2, 1): Expectation(time=1, memory=1),
+    (2, 2): Expectation(time=1, memory=1),
+    (3, 1): Expectation(time=1, memory=1),
+    (3, 2): Expectation(time=1, memory=1),
+    (4, 1): Expectation(time=1, memory=1),
+    (4, 2): Expectation(time=1, memory=1),
+    (5, 1): Expectation(time=1, memory=1),
+    (5, 2): Expectation(time=1, memory=1),
+    (6, 1): Expectation(time=1, memory=1),
+    (6, 2): Expectation(time=1, memory=1),
+    (7, 1): Expectation(time=1, memory=1),
+    (7, 2): Expectation(time=1, memory=1),
+    (8, 1): Expectation(time=1, memory=1),
+    (8, 2): Expectation(time=1, memory=1),
+    (9, 1): Expectation(time=2, memory=2),
+    (9, 2): Expectation(time=2, memory=2),
+    (10, 1): Expectation(time=1, memory=1),
+    (10, 2): Expectation(time=1, memory=1),
+    (11, 1): Expectation(time=2, memory=2),
+    # Random grids need not ever flash all at once.
+    (11, 2): Expectation(time=None, memory=None),
+    # The number of paths grows exponentially.
+    (12, 1): Expectation(time=None, memory=None),
+    (12, 2): Expectation(time=None, memory=None),
+    (13, 1): Expectation(time=1, memory=1),
+    (13, 2): Expectation(time=1, memory=1),
+    (14, 1): Expectation(time=1, memory=1),
+    (14, 2): Expectation(time=1, memory=1),
+    (15, 1): Expectation(time=2, memory=2),
+    (15, 2): Expectation(time=2, memory=2),
+    (16, 1): Expectation(time=1, memory=1),
+    (16, 2): Expectation(time=1, memory=1),
+    (17, 1): Expectation(time=2, memory=2),
+    (17, 2): Expectation(time=2, memory=2),
+    (18, 1): Expectation(time=1, memory=1),
+    (18, 2): Expectation(time=2, memory=1),
+    (19, 1): Expectation(time=2, memory=1),
+    (19, 2): Expectation(time=2, memory=1),
+    (20, 1): Expectation(time=2, memory=2),
+    (20, 2): Expectation(time=2, memory=2),
+    (21, 1): Expectation(time=None, memory=None),
+    (21, 2): Expectation(time=None, memory=None),
+    (22, 1): Expectation(time=1, memory=1),
+    (22, 2): Expectation(time=2, memory=2),
+    (23, 1): Expectation(time=None, memory=None),
+    (23, 2): Expectation(time=None, memory=None),
+    (24, 1): Expectation(time=1, memory=1),
+    (24, 2): Expectation(time=1, memory=1),
+    (25, 1): Expectation(time=3, memory=2),
+    (25, 2): Expectation(time=None, memory=None),
+}
+
+DAYS = sorted(BASE_SIZES)
+
+
+class Measurement(NamedTuple):
+    size: int
+    time: float
+    peak_memory: Optional[int]
+
+
+class ScalingResult(NamedTuple):
+    day: int
+    part: int
+    measurements: List[Measurement]
+    time_exponent: Optional[float]
+    memory_exponent: Optional[float]
+    expected: Expectation
+    error: Optional[str]
+
+    def flags(self, *, tolerance: float) -> List[str]:
+        """Return a description of each exponent that exceeds its expectation
+        by more than the specified 'tolerance'."""
+
+        flags = []
+
+        for name, exponent, expected in [
+            ("time", self.time_exponent, self.expected.time),
+            ("memory", self.memory_exponent, self.expected.memory),
+        ]:
+            if exponent is not None and expected is not None:
+                if exponent > expected + tolerance:
+                    flags.append(f"{name} ~ n^{exponent:.2f}, expected n^{expected:g}")
+
+        return flags
+
+
+def fit_exponent(sizes: List[int], values: List[float]) -> Optional[float]:
+    """Return the least-squares slope of 'log(values)' against 'log(sizes)',
+    or 'None' if there are fewer than two positive values to fit."""
+
+    points = [
+        (math.log(size), math.log(value))
+        for size, value in zip(sizes, values)
+        if value > 0
+    ]
+    if len(points) < 2:
+        return None
+
+    xs, ys = zip(*points)
+    mean_x = statistics.mean(xs)
+    mean_y = statistics.mean(ys)
+
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in points)
+
+    return covariance / variance
+
+
+def geometric_sizes(base_size: int, *, factor: int, steps: int) -> List[int]:
+    """..."""
+
+    return [base_size * factor ** step for step in range(steps)]
+
+
+def measure_scaling(
+    day: int,
+    part: int,
+    *,
+    factor: int,
+    steps: int,
+    repeat: int,
+    seed: int,
+    max_seconds: float,
+    trace_memory: bool,
+) -> Generator[Measurement, None, None]:
+    """Yield a measurement of the specified 'part' of the specified 'day' for
+    each size of a geometric series.  The series stops early once the next
+    size is predicted, from the exponent so far, to take longer than the
+    specified 'max_seconds'."""
+
+    module = importlib.import_module(f"python.day{day}")
+    solution = module.part1 if part == 1 else module.part2
+
+    measurements: List[Measurement] = []
+
+    for size in geometric_sizes(BASE_SIZES[day], factor=factor, steps=steps):
+        if measurements:
+            exponent = fit_exponent(
+                [measurement.size for measurement in measurements],
+                [measurement.time for measurement in measurements],
+            )
+            predicted_time = measurements[-1].time * (size / measurements[-1].size) ** (
+                1 if exponent is None else max(1, exponent)
+            )
+            if predicted_time > max_seconds:
+                return
+
+        input = generate(day, size, seed=seed)
+
+        # Some solutions (e.g. day 13) render their answer to stdout.
+        with contextlib.redirect_stdout(io.StringIO()):
+            timings = time_solution(solution, input, warmup=0, repeat=repeat)
+            peak_memory = measure_peak_memory(solution, input) if trace_memory else None
+
+        measurement = Measurement(size=size, time=min(timings), peak_memory=peak_memory)
+        measurements.append(measurement)
+        yield measurement
+
+
+def profile_scaling(
+    day: int,
+    part: int,
+    *,
+    factor: int,
+    steps: int,
+    repeat: int,
+    seed: int,
+    max_seconds: float,
+    trace_memory: bool,
+) -> ScalingResult:
+    """..."""
+
+    expected = EXPECTATIONS[(day, part)]
+    measurements: List[Measurement] = []
+    error = None
+
+    try:
+        measurements.extend(
+            measure_scaling(
+                day,
+                part,
+                factor=factor,
+                steps=steps,
+                repeat=repeat,
+                seed=seed,
+                max_seconds=max_seconds,
+                trace_memory=trace_memory,
+            )
+        )
+    except Exception as exception:
+        error = f"{type(exception).__name__}: {exception}"
+
+    timed = [
+        measurement
+        for measurement in measurements
+        if measurement.time >= MIN_MEASURABLE_TIME
+    ]
+    time_exponent = fit_exponent(
+        [measurement.size for measurement in timed],
+        [measurement.time for measurement in timed],
+    )
+
+    memory_exponent = (
+        fit_exponent(
+            [measurement.size for measurement in measurements],
+            [measurement.peak_memory for measurement in measurements],
+        )
+        if trace_memory
+        else None
+    )
+
+    return ScalingResult(
+        day=day,
+        part=part,
+        measurements=measurements,
+        time_exponent=time_exponent,
+        memory_exponent=memory_exponent,
+        expected=expected,
+        error=error,
+    )
+
+
+def format_exponent(exponent: Optional[float]) -> str:
+    """..."""
+
+    return "-" if exponent is None else f"n^{exponent:.2f}"
+
+
+def format_result(result: ScalingResult, *, tolerance: float) -> str:
+    """..."""
+
+    key = f"day{result.day}/part{result.part}"
+
+    if result.error is not None:
+        return f"{key:<14} ERROR {result.error}"
+
+    sizes = ",".join(str(measurement.size) for measurement in result.measurements)
+    flags = result.flags(tolerance=tolerance)
+
+    return (
+        f"{key:<14} time={format_exponent(result.time_exponent):<8} "
+        f"memory={format_exponent(result.memory_exponent):<8} sizes={sizes}"
+        + "".join(f"\n  WORSE THAN EXPECTED: {flag}" for flag in flags)
+    )
+
+
+def dump_results(results: List[ScalingResult], path: Path) -> None:
+    """..."""
+
+    payload = {
+        "python": sys.version.split()[0],
+        "results": {
+            f"day{result.day}/part{result.part}": {
+                "measurements": [
+                    measurement._asdict() for measurement in result.measurements
+                ],
+                "time_exponent": result.time_exponent,
+                "memory_exponent": result.memory_exponent,
+                "expected": result.expected._asdict(),
+                "error": result.error,
+            }
+            for result in results
+        },
+    }
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n")
+
+
+def parse_args(args: List[str]) -> argparse.Namespace:
+    """..."""
+
+    parser = argparse.ArgumentParser(prog="python -m python.complexity")
+    parser.add_argument("--days", type=int, nargs="+", choices=DAYS, default=DAYS)
+    parser.add_argument("--parts", type=int, nargs="+", choices=PARTS, default=PARTS)
+    parser.add_argument("--factor", type=int, default=2)
+    parser.add_argument("--steps", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-seconds", type=float, default=10.0)
+    parser.add_argument("--tolerance", type=float, default=0.3)
+    parser.add_argument("--no-memory", action="store_true")
+    parser.add_argument("--output", type=Path)
+
+    parsed_args = parser.parse_args(args)
+    assert parsed_args.factor > 1, f"Factor ({parsed_args.factor}) must exceed 1"
+    assert parsed_args.steps > 1, f"Steps ({parsed_args.steps}) must exceed 1"
+    assert parsed_args.repeat > 0, f"Repeat ({parsed_args.repeat}) must be positive"
+
+    return parsed_args
+
+
+def main(args: List[str]) -> int:
+    """..."""
+
+    parsed_args = parse_args(args)
+
+    results: List[ScalingResult] = []
+    num_flagged = 0
+
+    for day in parsed_args.days:
+        for part in parsed_args.parts:
+            if EXPECTATIONS[(day, part)].time is None:
+                continue
+
+            result = profile_scaling(
+                day,
+                part,
+                factor=parsed_args.factor,
+                steps=parsed_args.steps,
+                repeat=parsed_args.repeat,
+                seed=parsed_args.seed,
+                max_seconds=parsed_args.max_seconds,
+                trace_memory=not parsed_args.no_memory,
+            )
+            print(format_result(result, tolerance=parsed_args.tolerance), flush=True)
+
+            results.append(result)
+            num_flagged += bool(result.flags(tolerance=parsed_args.tolerance))
+
+    if parsed_args.output is not None:
+        dump_results(results, parsed_args.output)
+
+    return 1 if num_flagged else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
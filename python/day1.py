@@ -1,14 +1,78 @@
+import itertools
+import operator
 import sys
+from array import array
 from collections import deque
-from typing import List
+from pathlib import Path
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
-from python.util import run_solution
+from python.parse import DEFAULT_TYPECODE, parse_int_lines
+from python.util import (
+    DEFAULT_CHUNK_SIZE,
+    EXECUTOR,
+    Input,
+    InputStream,
+    accepts_input_stream,
+    read_chunk,
+    run_solution,
+)
 
 
-def parse_measurements(input: str) -> List[int]:
-    """..."""
+class ChunkSummary(NamedTuple):
+    """The increments within one chunk of measurements, together with what is
+    needed to count the increments across its boundaries: its first
+    'window_size' measurements ('head'), and up to 'window_size' of its last
+    measurements that are not in 'head' ('tail')."""
+
+    num_measurements: int
+    increments: int
+    head: List[int]
+    tail: List[int]
+
+
+ChunkTask = Tuple[Union[Path, bytes], int, int, int]
+
+
+def parse_measurements(input: Input) -> Iterator[int]:
+    """Return an iterator over the measurements of the specified 'input'.  An
+    'InputStream' is parsed one chunk at a time, in bounded memory."""
+
+    if isinstance(input, InputStream):
+        return itertools.chain.from_iterable(map(parse_int_lines, input.chunks()))
+
+    return iter(parse_int_lines(input))
+
 
-    return map(int, input.splitlines())
+def parse_measurement_list(input: Input) -> List[int]:
+    """Return the measurements of the specified 'input' as one list, as
+    'count_increments_in_bulk' expects."""
+
+    if isinstance(input, InputStream):
+        measurements: List[int] = []
+        for chunk in input.chunks():
+            measurements.extend(parse_int_lines(chunk))
+
+        return measurements
+
+    return parse_int_lines(input)
+
+
+def parse_measurement_array(input: Input) -> array:
+    """Return the measurements of the specified 'input' as one contiguous
+    'array', which 'count_increments_for_windows' shares between window
+    sizes through a 'memoryview'."""
+
+    return array(DEFAULT_TYPECODE, parse_measurement_list(input))
 
 
 def count_increments(measurements: List[int], *, window_size: int) -> int:
@@ -41,18 +105,131 @@ def count_increments(measurements: List[int], *, window_size: int) -> int:
     return increments
 
 
-def part1(input: str) -> int:
+def count_increments_in_bulk(measurements: Sequence[int], *, window_size: int) -> int:
+    """Return the same count as 'count_increments', for measurements held in
+    memory.  Consecutive windows share all but their first and last
+    measurements, so a window sum increases exactly when the measurement that
+    enters the window exceeds the one that leaves it.  Every such pair is then
+    compared in a single pass of 'map', without computing any window sums."""
+
+    assert window_size > 0, f"Window size ({window_size}) must be positive"
+    assert window_size <= len(measurements), (
+        f"Window size ({window_size}) must not exceed number of "
+        f"measurements ({len(measurements)})"
+    )
+
+    return sum(map(operator.lt, measurements, measurements[window_size:]))
+
+
+def count_increments_for_windows(
+    measurements: array,
+    window_sizes: Iterable[int],
+    *,
+    start: int = 0,
+    stop: Optional[int] = None,
+) -> Dict[int, int]:
+    """Return the number of increments for each of the specified
+    'window_sizes', as 'count_increments_in_bulk' would, counting only the
+    windows that lie within the measurements at '[start, stop)'.  The
+    measurements are parsed once and shared, without copies, by every window
+    size through a 'memoryview'."""
+
+    start, stop, _ = slice(start, stop).indices(len(measurements))
+    view = memoryview(measurements)[start:stop]
+
+    counts = {}
+    for window_size in sorted(set(window_sizes)):
+        counts[window_size] = count_increments_in_bulk(view, window_size=window_size)
+
+    return counts
+
+
+def summarise_chunk(task: ChunkTask) -> ChunkSummary:
+    """Return the summary of the chunk of measurements described by the
+    specified 'task', of the form '(source, start, stop, window_size)'.  The
+    chunk is read and parsed by the worker itself, so only its source and
+    offsets, and not its bytes, cross the process boundary."""
+
+    source, start, stop, window_size = task
+    measurements = parse_int_lines(read_chunk(source, start, stop))
+
+    return ChunkSummary(
+        num_measurements=len(measurements),
+        increments=sum(map(operator.lt, measurements, measurements[window_size:])),
+        head=measurements[:window_size],
+        tail=measurements[max(window_size, len(measurements) - window_size) :],
+    )
+
+
+def count_increments_in_chunks(
+    input: InputStream, *, window_size: int, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> int:
+    """Return the same count as 'count_increments', for the specified 'input'
+    split into chunks of about the specified 'chunk_size' bytes, which the
+    shared executor summarises in parallel.  The last 'window_size'
+    measurements before each boundary are carried over and compared with the
+    first of the next chunk, so increments across boundaries are counted
+    exactly, while no more than one chunk is held in memory per worker."""
+
+    assert window_size > 0, f"Window size ({window_size}) must be positive"
+
+    summaries = EXECUTOR.map(
+        summarise_chunk,
+        (
+            (source, start, stop, window_size)
+            for source, start, stop in input.chunk_sources(chunk_size)
+        ),
+    )
+
+    num_measurements = 0
+    increments = 0
+    carry: List[int] = []
+
+    for summary in summaries:
+        window = carry + summary.head
+
+        # Count the pairs that start before the boundary and end after it.
+        increments += summary.increments + sum(
+            window[index] < window[index + window_size]
+            for index in range(len(carry))
+            if index + window_size < len(window)
+        )
+
+        num_measurements += summary.num_measurements
+        carry = (window + summary.tail)[-window_size:]
+
+    assert window_size <= num_measurements, (
+        f"Window size ({window_size}) must not exceed number of "
+        f"measurements ({num_measurements})"
+    )
+
+    return increments
+
+
+def count_input_increments(input: Input, *, window_size: int) -> int:
+    """Return the number of increments of the specified 'input', processing
+    an 'InputStream' of more than one chunk out of core and in parallel, and
+    any other input in memory and in bulk."""
+
+    if isinstance(input, InputStream) and len(input) > DEFAULT_CHUNK_SIZE:
+        return count_increments_in_chunks(input, window_size=window_size)
+
+    measurements = parse_measurement_list(input)
+    return count_increments_in_bulk(measurements, window_size=window_size)
+
+
+@accepts_input_stream
+def part1(input: Input) -> int:
     """..."""
 
-    measurements = parse_measurements(input)
-    return count_increments(measurements, window_size=1)
+    return count_input_increments(input, window_size=1)
 
 
-def part2(input: str) -> int:
+@accepts_input_stream
+def part2(input: Input) -> int:
     """..."""
 
-    measurements = parse_measurements(input)
-    return count_increments(measurements, window_size=3)
+    return count_input_increments(input, window_size=3)
 
 
 if __name__ == "__main__":
@@ -1,20 +1,26 @@
 import sys
 from collections import deque
-from typing import Generator, List, Set, Tuple
+from typing import Generator, List, Set, Tuple, Union
 
+from python.grid import Grid as CompactGrid
+from python.parse import parse_digit_grid, parse_digit_rows
 from python.util import run_solution
 
 
 MAX_ENERGY_LEVEL = 9
 
-Grid = List[List[int]]
+Grid = Union[List[List[int]], CompactGrid]
 Point = Tuple[int, int]
 
 
-def parse_grid(input: str) -> Grid:
-    """..."""
+def parse_grid(input: str, *, compact: bool = False) -> Grid:
+    """Return the grid of the specified 'input', as a 'CompactGrid' with one
+    byte per cell if 'compact' is set, and as a list of rows otherwise."""
+
+    if compact:
+        return parse_digit_grid(input)
 
-    return [list(map(int, line)) for line in input.splitlines()]
+    return parse_digit_rows(input)
 
 
 def dimensions(grid: Grid) -> Tuple[int, int]:
@@ -4,6 +4,7 @@ import re
 import sys
 from typing import Counter, List, Literal, NamedTuple, Union
 
+from python.parse import iter_records, parse_records
 from python.util import run_solution
 
 
@@ -25,28 +26,22 @@ class TransparentPaper(NamedTuple):
     instructions: List[FoldInstruction]
 
 
-def parse_dot(line: str) -> Dot:
-    """..."""
-
-    tokens = line.split(",")
-    assert len(tokens) == 2, f"Expected 2 tokens on line '{line}', found {len(tokens)}"
-
-    x, y = tokens
-    return Dot(x=int(x), y=int(y))
+FOLD_INSTRUCTION_PATTERN = re.compile(r"fold along (?P<axis>[xy])=(?P<value>\d+)")
 
 
 def parse_grid(input: str) -> Counter[Dot]:
     """..."""
 
-    return collections.Counter(map(parse_dot, input.splitlines()))
+    dots = parse_records(input, num_fields=2)
+    return collections.Counter(
+        Dot(x=x, y=y) for x, y in iter_records(dots, num_fields=2)
+    )
 
 
 def parse_instruction(line: str) -> FoldInstruction:
     """..."""
 
-    pattern = re.compile(r"fold along (?P<axis>[xy])=(?P<value>\d+)")
-
-    match = pattern.match(line)
+    match = FOLD_INSTRUCTION_PATTERN.match(line)
     assert match is not None, f"Invalid input ({line})"
 
     return FoldInstruction(axis=match.group("axis"), value=int(match.group("value")))
@@ -1,17 +1,23 @@
 import sys
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, Union
 
-from python.util import run_solution
+from python.grid import Grid
+from python.parse import parse_digit_grid, parse_digit_rows
+from python.util import INSTRUMENTATION, run_solution
 
 
-Cavern = List[List[int]]
+Cavern = Union[List[List[int]], Grid]
 Position = Tuple[int, int]
 
 
-def parse_cavern(input: str) -> Cavern:
-    """..."""
+def parse_cavern(input: str, *, compact: bool = False) -> Cavern:
+    """Return the cavern of the specified 'input', as a 'Grid' with one byte
+    per position if 'compact' is set, and as a list of rows otherwise."""
+
+    if compact:
+        return parse_digit_grid(input)
 
-    return [list(map(int, line)) for line in input.splitlines()]
+    return parse_digit_rows(input)
 
 
 def get_dimensions(cavern: Cavern) -> Tuple[int, int]:
@@ -48,6 +54,9 @@ def find_minimum_risk_from_top_left_to_bottom_right(cavern: Cavern) -> int:
     candidates: Dict[Position, int] = {(0, 0): 0}
     seen = set()
 
+    # Checked once, as this loop is hot.
+    instrumented = INSTRUMENTATION.enabled
+
     while candidates:
         min_risk, curr_position = min(
             (risk, position) for position, risk in candidates.items()
@@ -55,6 +64,10 @@ def find_minimum_risk_from_top_left_to_bottom_right(cavern: Cavern) -> int:
         del candidates[curr_position]
         seen.add(curr_position)
 
+        if instrumented:
+            INSTRUMENTATION.count("day15.pops")
+            INSTRUMENTATION.observe("day15.frontier_size", len(candidates) + 1)
+
         if curr_position == bottom_right:
             return min_risk
 
@@ -74,15 +87,77 @@ def find_minimum_risk_from_top_left_to_bottom_right(cavern: Cavern) -> int:
                 candidates[adjacent_position] = min_risk + cavern[x][y]
 
 
+def find_minimum_risk_across_grid(cavern: Grid) -> int:
+    """Return the lowest total risk from the top left to the bottom right of the
+    specified 'cavern', as for 'find_minimum_risk_from_top_left_to_bottom_right'
+    but over flat indices, reading risks straight from 'cavern.cells'."""
+
+    cells = cavern.cells
+    neighbours = cavern.neighbours
+    bottom_right = len(cells) - 1
+
+    candidates: Dict[int, int] = {0: 0}
+    seen = set()
+
+    # Checked once, as this loop is hot.
+    instrumented = INSTRUMENTATION.enabled
+
+    while candidates:
+        min_risk, curr_index = min((risk, index) for index, risk in candidates.items())
+        del candidates[curr_index]
+        seen.add(curr_index)
+
+        if instrumented:
+            INSTRUMENTATION.count("day15.pops")
+            INSTRUMENTATION.observe("day15.frontier_size", len(candidates) + 1)
+
+        if curr_index == bottom_right:
+            return min_risk
+
+        for adjacent_index in neighbours(curr_index):
+            if adjacent_index in seen:
+                continue
+
+            risk = min_risk + cells[adjacent_index]
+            if adjacent_index not in candidates or risk < candidates[adjacent_index]:
+                candidates[adjacent_index] = risk
+
+
 def increment(cavern: Cavern) -> Cavern:
     """..."""
 
     return [[1 if risk == 9 else risk + 1 for risk in row] for row in cavern]
 
 
+def render_full_grid(cavern: Grid, *, scale: int) -> Grid:
+    """Return the full map of the specified 'cavern', built a row of a tile
+    at a time with 'bytes.translate'."""
+
+    # The tile at '(tile_row, tile_col)' is incremented 'tile_row + tile_col'
+    # times, where incrementing wraps a risk of 9 back round to 1.
+    risks = bytes(range(1, 10))
+    increments = [
+        bytes.maketrans(risks, risks[shift % 9 :] + risks[: shift % 9])
+        for shift in range(2 * scale - 1)
+    ]
+
+    cells = bytearray()
+    for tile_row in range(scale):
+        for row in cavern:
+            for tile_col in range(scale):
+                cells += row.tobytes().translate(increments[tile_row + tile_col])
+
+    return Grid(
+        cells, num_rows=cavern.num_rows * scale, num_cols=cavern.num_cols * scale
+    )
+
+
 def render_full_map(cavern: Cavern, *, scale: int) -> Cavern:
     """..."""
 
+    if isinstance(cavern, Grid):
+        return render_full_grid(cavern, scale=scale)
+
     sections = [[None for _ in range(scale)] for _ in range(scale)]
     sections[0][0] = cavern
 
@@ -120,18 +195,18 @@ def render_full_map(cavern: Cavern, *, scale: int) -> Cavern:
 def part1(input: str) -> int:
     """..."""
 
-    cavern = parse_cavern(input)
+    cavern = parse_cavern(input, compact=True)
 
-    return find_minimum_risk_from_top_left_to_bottom_right(cavern)
+    return find_minimum_risk_across_grid(cavern)
 
 
 def part2(input: str) -> int:
     """..."""
 
-    cavern = parse_cavern(input)
+    cavern = parse_cavern(input, compact=True)
     full_map = render_full_map(cavern, scale=5)
 
-    return find_minimum_risk_from_top_left_to_bottom_right(full_map)
+    return find_minimum_risk_across_grid(full_map)
 
 
 if __name__ == "__main__":
@@ -1,11 +1,9 @@
 import functools
-import multiprocessing
-import os
 import re
 import sys
 from typing import List, NamedTuple, Optional
 
-from python.util import run_solution
+from python.util import EXECUTOR, run_solution
 
 
 class TargetArea(NamedTuple):
@@ -117,10 +115,9 @@ def find_plausible_trajectories_for_any_initial_velocity(
         simulate_trajectory, initial_position=origin, target_area=target_area
     )
 
-    with multiprocessing.Pool(os.cpu_count() or 4) as pool:
-        trajectories = pool.map(
-            simulate_trajectory_given_initial_velocity, candidate_initial_velocities
-        )
+    trajectories = EXECUTOR.map(
+        simulate_trajectory_given_initial_velocity, candidate_initial_velocities
+    )
 
     return list(filter(None, trajectories))
 
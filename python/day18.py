@@ -2,7 +2,7 @@ import functools
 import sys
 from typing import NamedTuple, Optional, Tuple, Union
 
-from python.util import run_solution
+from python.util import INSTRUMENTATION, run_solution
 
 
 class SnailfishNumber(NamedTuple):
@@ -209,10 +209,12 @@ def reduce_snailfish_number(num: SnailfishNumber) -> SnailfishNumber:
 
     try_explode, num = apply_explode_action_if_applicable(num, level=0)
     if try_explode is not None:
+        INSTRUMENTATION.count("day18.explodes")
         return reduce_snailfish_number(num)
 
     try_split, num = apply_split_action_if_applicable(num)
     if try_split:
+        INSTRUMENTATION.count("day18.splits")
         return reduce_snailfish_number(num)
 
     return num
@@ -1,8 +1,6 @@
 from collections import defaultdict
 from dataclasses import dataclass
 import functools
-import multiprocessing
-import os
 import re
 import sys
 from typing import (
@@ -17,7 +15,8 @@ from typing import (
     Tuple,
 )
 
-from python.util import run_solution
+from python.parse import iter_records, parse_records
+from python.util import EXECUTOR, INSTRUMENTATION, cached_parser, run_solution
 
 
 @dataclass(eq=True, frozen=True)
@@ -285,33 +284,34 @@ ROTATION_MATRICES = [
 ]
 
 
-def parse_beacon(line: str) -> Point:
-    """..."""
-
-    tokens = list(map(int, line.split(",")))
-    assert len(tokens) == 3, f"Expected 3 tokens in line '{line}', got {len(tokens)}"
-
-    x, y, z = tokens
-    return Point(x, y, z)
+SCANNER_HEADER_PATTERN = re.compile(r"--- scanner (\d+) ---")
 
 
 def parse_scanner(lines: str) -> Scanner:
     """..."""
 
-    lines_iter = iter(lines.splitlines())
-
-    header_pattern = re.compile(r"--- scanner (\d+) ---")
-    header = next(lines_iter)
-    header_match = header_pattern.match(header)
+    header, _, beacons_input = lines.partition("\n")
+    header_match = SCANNER_HEADER_PATTERN.match(header)
 
     assert header_match is not None, f"Invalid header: {header}"
     scanner_id = int(header_match.group(1))
 
-    beacons_relative_pos = set(map(parse_beacon, lines_iter))
+    beacons = parse_records(beacons_input, num_fields=3)
+    beacons_relative_pos = set(
+        Point(x, y, z) for x, y, z in iter_records(beacons, num_fields=3)
+    )
 
     return Scanner(scanner_id, beacons_relative_pos)
 
 
+@cached_parser
+def parse_scanners(input: str) -> List[Scanner]:
+    """..."""
+
+    scanners_input = input.split("\n\n")
+    return sorted(map(parse_scanner, scanners_input), key=lambda scanner: scanner.id)
+
+
 def try_align_beacons_via_translation(beacons1: Set[Point], beacons2: Set[Point]):
     """..."""
 
@@ -336,6 +336,8 @@ def try_align_scanners(
     base_scanner, relative_scanner = scanner_pair
 
     for rotation_matrix in ROTATION_MATRICES:
+        INSTRUMENTATION.count("day19.rotations_tried")
+
         rotated_beacons2 = set(
             rotation_matrix(beacon) for beacon in relative_scanner.beacons
         )
@@ -350,6 +352,7 @@ def try_align_scanners(
                 ]
             )
 
+            INSTRUMENTATION.count("day19.alignments_found")
             return base_scanner.id, relative_scanner.id, transform
 
     return None
@@ -413,9 +416,9 @@ def get_normalised_transforms(scanners: List[Scanner], *, base_scanner_id: int):
         if base_scanner.id != relative_scanner.id
     )
 
-    with multiprocessing.Pool(os.cpu_count() or 4) as pool:
+    with INSTRUMENTATION.span("day19.align_all_scanner_pairs"):
         potential_alignments = filter(
-            None, pool.map(try_align_scanners, all_scanner_pairs)
+            None, EXECUTOR.map(try_align_scanners, all_scanner_pairs)
         )
 
     alignment_transformations: DefaultDict[
@@ -436,10 +439,7 @@ def get_normalised_transforms(scanners: List[Scanner], *, base_scanner_id: int):
 def part1(input: str) -> int:
     """..."""
 
-    scanners_input = input.split("\n\n")
-    scanners = sorted(
-        map(parse_scanner, scanners_input), key=lambda scanner: scanner.id
-    )
+    scanners = parse_scanners(input)
 
     transforms = get_normalised_transforms(scanners, base_scanner_id=0)
 
@@ -454,10 +454,7 @@ def part1(input: str) -> int:
 def part2(input: str) -> int:
     """..."""
 
-    scanners_input = input.split("\n\n")
-    scanners = sorted(
-        map(parse_scanner, scanners_input), key=lambda scanner: scanner.id
-    )
+    scanners = parse_scanners(input)
 
     transforms = get_normalised_transforms(scanners, base_scanner_id=0)
     normalised_origins = [transform(Point(0, 0, 0)) for transform in transforms]
@@ -1,8 +1,22 @@
 import functools
+import itertools
+import operator
 import sys
-from typing import Callable, Dict, List, Literal, NamedTuple, TypeVar, Union
-
-from python.util import run_solution
+from array import array
+from pathlib import Path
+from typing import Iterable, List, Literal, NamedTuple, Tuple, Union
+
+from python.parse import DEFAULT_TYPECODE
+from python.util import (
+    DEFAULT_CHUNK_SIZE,
+    EXECUTOR,
+    Input,
+    InputStream,
+    accepts_input_stream,
+    input_lines,
+    read_chunk,
+    run_solution,
+)
 
 
 _SUPPORTED_COMMANDS = ("forward", "down", "up")
@@ -13,9 +27,12 @@ class Command(NamedTuple):
     magnitude: int
 
 
-def parse_command(line: str) -> Command:
+def parse_command(line: Union[str, bytes]) -> Command:
     """..."""
 
+    if isinstance(line, bytes):
+        line = line.decode()
+
     tokens = line.split(" ")
     assert len(tokens) == 2, f"Expected 2 tokens on line '{line}', found {len(tokens)}"
 
@@ -29,99 +46,206 @@ def parse_command(line: str) -> Command:
     return Command(direction, magnitude)
 
 
-def parse_commands(input: str) -> List[Command]:
+def parse_commands(input: Input) -> List[Command]:
     """..."""
 
-    return map(parse_command, input.splitlines())
+    return map(parse_command, input_lines(input))
+
+
+class Transform(NamedTuple):
+    """The effect of a sequence of commands on the horizontal position, depth
+    and aim of the submarine.  Every command is an affine map of these: it
+    adds to the horizontal position and to the aim, and adds to the depth
+    both a constant and the aim times its horizontal move.  Composing two
+    such maps gives another, so transforms form a monoid under 'then', with
+    'IDENTITY' as its unit.  A transform applied to the origin is the position
+    that it ends at, so positions are transforms too."""
+
+    horizontal_position: int
+    depth: int
+    aim: int
+
+    def then(self, other: "Transform") -> "Transform":
+        """Return the transform that applies this transform, followed by the
+        specified 'other' transform."""
 
+        return Transform(
+            horizontal_position=self.horizontal_position + other.horizontal_position,
+            depth=self.depth + other.depth + self.aim * other.horizontal_position,
+            aim=self.aim + other.aim,
+        )
 
-State = TypeVar("State")
 
+IDENTITY = Transform(horizontal_position=0, depth=0, aim=0)
 
-def simulate_commands(
-    commands: List[Command],
-    transitions: Dict[str, Callable[[Command, State], State]],
-    initialState: State,
-) -> State:
+
+def command_transform(command: Command) -> Transform:
     """..."""
 
-    return functools.reduce(
-        lambda state, command: transitions[command.direction](command, state),
-        commands,
-        initialState,
-    )
+    if command.direction == "forward":
+        return Transform(horizontal_position=command.magnitude, depth=0, aim=0)
+
+    if command.direction == "down":
+        return Transform(horizontal_position=0, depth=0, aim=command.magnitude)
+
+    return Transform(horizontal_position=0, depth=0, aim=-command.magnitude)
+
 
+def compose_commands(commands: Iterable[Command]) -> Transform:
+    """Return the transform of the specified 'commands', in order.  This is
+    'functools.reduce' of 'Transform.then' over each 'command_transform',
+    computed in local variables rather than through a tuple per command."""
 
-def part1(input: str) -> int:
+    horizontal_position = depth = aim = 0
+
+    for direction, magnitude in commands:
+        if direction == "forward":
+            horizontal_position += magnitude
+            depth += aim * magnitude
+        elif direction == "down":
+            aim += magnitude
+        else:
+            aim -= magnitude
+
+    return Transform(horizontal_position=horizontal_position, depth=depth, aim=aim)
+
+
+def compose_transforms(transforms: Iterable[Transform]) -> Transform:
     """..."""
 
-    commands = parse_commands(input)
+    return functools.reduce(Transform.then, transforms, IDENTITY)
 
-    class State(NamedTuple):
-        horizontal_position: int
-        depth: int
 
-    StateTransition = Callable[[Command, State], State]
+class CommandColumns(NamedTuple):
+    """Commands in columnar form: the first letter of each direction, and each
+    magnitude, negated for 'up' so that it is the change in aim of every
+    command other than 'forward'."""
 
-    forward: StateTransition = lambda command, state: State(
-        horizontal_position=state.horizontal_position + command.magnitude,
-        depth=state.depth,
-    )
+    directions: bytes
+    magnitudes: array
 
-    down: StateTransition = lambda command, state: State(
-        horizontal_position=state.horizontal_position,
-        depth=state.depth + command.magnitude,
-    )
 
-    up: StateTransition = lambda command, state: State(
-        horizontal_position=state.horizontal_position,
-        depth=state.depth - command.magnitude,
-    )
+# Map the first letter of each direction to whether it is 'forward', and to
+# whether it changes the aim.
+FORWARD_MASK = bytes.maketrans(b"fdu", b"\x01\x00\x00")
+AIM_MASK = bytes.maketrans(b"fdu", b"\x00\x01\x01")
 
-    transitions = dict(forward=forward, down=down, up=up)
+# Map the first letter of each direction to the sign of its magnitude in
+# 'CommandColumns', as a byte that reads as -1 or 1 in a signed 'array'.
+SIGN_MASK = bytes.maketrans(b"fdu", b"\x01\x01\xff")
 
-    initial_state = State(horizontal_position=0, depth=0)
-    final_state = simulate_commands(commands, transitions, initial_state)
 
-    return final_state.horizontal_position * final_state.depth
+def parse_command_columns(input: Union[Input, bytes]) -> CommandColumns:
+    """Return the commands of the specified 'input' as columns, tokenised
+    with one 'split' of the whole input, rather than one 'Command' per line."""
 
+    if isinstance(input, InputStream):
+        data = b"".join(input.chunks())
+    else:
+        data = input.encode() if isinstance(input, str) else input
 
-def part2(input: str) -> int:
-    """..."""
+    tokens = data.split()
 
-    commands = parse_commands(input)
+    # Count the lines without splitting them, including any last line that
+    # has no line terminator.
+    num_lines = data.count(b"\n") + (data[-1:] not in (b"", b"\n"))
+    assert (
+        len(tokens) == 2 * num_lines
+    ), f"Expected 2 tokens on each of {num_lines} lines, got {len(tokens)} in total"
 
-    class State(NamedTuple):
-        horizontal_position: int
-        depth: int
-        aim: int
+    directions = tokens[0::2]
+    supported = {direction.encode() for direction in _SUPPORTED_COMMANDS}
+    assert set(directions) <= supported, (
+        f"Directions not all one of the supported: {','.join(_SUPPORTED_COMMANDS)}"
+    )
 
-    StateTransition = Callable[[Command, State], State]
+    first_letters = bytes(map(operator.itemgetter(0), directions))
+    signs = array("b")
+    signs.frombytes(first_letters.translate(SIGN_MASK))
 
-    forward: StateTransition = lambda command, state: State(
-        horizontal_position=state.horizontal_position + command.magnitude,
-        depth=state.depth + state.aim * command.magnitude,
-        aim=state.aim,
+    return CommandColumns(
+        directions=first_letters,
+        magnitudes=array(
+            DEFAULT_TYPECODE, map(operator.mul, map(int, tokens[1::2]), signs)
+        ),
     )
 
-    down: StateTransition = lambda command, state: State(
-        horizontal_position=state.horizontal_position,
-        depth=state.depth,
-        aim=state.aim + command.magnitude,
+
+def evaluate_command_columns(columns: CommandColumns) -> Transform:
+    """Return the transform of the specified 'columns', as 'compose_commands'
+    would, with reductions and prefix sums over whole columns.  The aim at
+    each 'forward' is the running sum of all magnitudes up to it, less the
+    running sum of the 'forward' magnitudes up to it, so the depth is the
+    sum over 'forward' commands of their magnitude times that difference."""
+
+    is_forward = columns.directions.translate(FORWARD_MASK)
+    is_aim = columns.directions.translate(AIM_MASK)
+
+    forward_magnitudes = array(
+        DEFAULT_TYPECODE, itertools.compress(columns.magnitudes, is_forward)
+    )
+
+    running_sums = itertools.compress(
+        itertools.accumulate(columns.magnitudes), is_forward
+    )
+    running_forward_sums = itertools.accumulate(forward_magnitudes)
+    aims = map(operator.sub, running_sums, running_forward_sums)
+
+    return Transform(
+        horizontal_position=sum(forward_magnitudes),
+        depth=sum(map(operator.mul, forward_magnitudes, aims)),
+        aim=sum(itertools.compress(columns.magnitudes, is_aim)),
     )
 
-    up: StateTransition = lambda command, state: State(
-        horizontal_position=state.horizontal_position,
-        depth=state.depth,
-        aim=state.aim - command.magnitude,
+
+def compose_chunk(task: Tuple[Union[Path, bytes], int, int]) -> Transform:
+    """Return the transform of the commands in the chunk described by the
+    specified 'task', as yielded by 'InputStream.chunk_sources'."""
+
+    source, start, stop = task
+    columns = parse_command_columns(read_chunk(source, start, stop))
+    return evaluate_command_columns(columns)
+
+
+def compose_commands_in_chunks(
+    input: InputStream, *, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Transform:
+    """Return the transform of every command of the specified 'input', split
+    into chunks of about the specified 'chunk_size' bytes whose transforms
+    the shared executor computes in parallel, and which are then composed in
+    order.  This is exact because 'Transform.then' is associative."""
+
+    return compose_transforms(
+        EXECUTOR.map(compose_chunk, input.chunk_sources(chunk_size))
     )
 
-    transitions = dict(forward=forward, down=down, up=up)
 
-    initial_state = State(horizontal_position=0, depth=0, aim=0)
-    final_state = simulate_commands(commands, transitions, initial_state)
+def compose_input(input: Input) -> Transform:
+    """Return the transform of every command of the specified 'input',
+    processing an 'InputStream' of more than one chunk in parallel."""
+
+    if isinstance(input, InputStream) and len(input) > DEFAULT_CHUNK_SIZE:
+        return compose_commands_in_chunks(input)
+
+    return evaluate_command_columns(parse_command_columns(input))
+
+
+@accepts_input_stream
+def part1(input: Input) -> int:
+    """..."""
+
+    # Without aim, 'down' and 'up' change the depth exactly as they change the
+    # aim with it, so the aim of the transform is the depth of part 1.
+    position = compose_input(input)
+    return position.horizontal_position * position.aim
+
+
+@accepts_input_stream
+def part2(input: Input) -> int:
+    """..."""
 
-    return final_state.horizontal_position * final_state.depth
+    position = compose_input(input)
+    return position.horizontal_position * position.depth
 
 
 if __name__ == "__main__":
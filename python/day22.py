@@ -1,10 +1,10 @@
 from collections import deque
 from dataclasses import dataclass, field
-import re
 import sys
 from typing import Dict, List, NamedTuple
 
-from python.util import run_solution
+from python.parse import iter_records, parse_ranges
+from python.util import cached_parser, run_solution
 
 
 class Coordinate(NamedTuple):
@@ -310,37 +310,28 @@ class CubeSingleDimension:
         )
 
 
-def parse_reboot_step(line: str) -> RebootStep:
+@cached_parser
+def parse_reboot_steps(input: str) -> List[RebootStep]:
     """..."""
 
-    pattern = re.compile(
-        r"(?P<state>on|off) x=(?P<x_min>-?\d+)..(?P<x_max>-?\d+),y=(?P<y_min>-?\d+)..(?P<y_max>-?\d+),z=(?P<z_min>-?\d+)..(?P<z_max>-?\d+)"
-    )
+    lines = input.splitlines()
+    assert all(
+        line.startswith(("on ", "off ")) for line in lines
+    ), "Expected every reboot step to start with 'on' or 'off'"
 
-    match = pattern.match(line)
-    assert match is not None, f"Invalid input: {line}"
-
-    parameters = match.groupdict()
-    on = parameters["state"] == "on"
-    x_min = int(parameters["x_min"])
-    x_max = int(parameters["x_max"])
-    y_min = int(parameters["y_min"])
-    y_max = int(parameters["y_max"])
-    z_min = int(parameters["z_min"])
-    z_max = int(parameters["z_max"])
-
-    return RebootStep(
-        on=on,
-        x_range=CoordinateRange(x_min, x_max),
-        y_range=CoordinateRange(y_min, y_max),
-        z_range=CoordinateRange(z_min, z_max),
-    )
+    ranges = parse_ranges(input, num_dimensions=3)
 
-
-def parse_reboot_steps(input: str) -> List[RebootStep]:
-    """..."""
-
-    return list(map(parse_reboot_step, input.splitlines()))
+    return [
+        RebootStep(
+            on=line.startswith("on "),
+            x_range=CoordinateRange(x_min, x_max),
+            y_range=CoordinateRange(y_min, y_max),
+            z_range=CoordinateRange(z_min, z_max),
+        )
+        for line, (x_min, x_max, y_min, y_max, z_min, z_max) in zip(
+            lines, iter_records(ranges, num_fields=6)
+        )
+    ]
 
 
 def has_overlap(range: CoordinateRange, other_range: CoordinateRange) -> bool:
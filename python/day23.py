@@ -4,7 +4,7 @@ import math
 import sys
 from typing import Dict, List, NamedTuple, Set, Tuple
 
-from python.util import run_solution
+from python.util import INSTRUMENTATION, run_solution
 
 
 @dataclass(frozen=True, order=True)
@@ -258,9 +258,11 @@ def organise_amphipods(
         return acc
 
     if serialised_grid in cache:
+        INSTRUMENTATION.count("day23.cache_hits")
         return cache[serialised_grid]
 
     seen_grids.add(serialised_grid)
+    INSTRUMENTATION.count("day23.nodes_expanded")
 
     num_rows, num_cols = dimensions(grid)
 
@@ -1,10 +1,11 @@
 import sys
-from typing import List, Tuple
+from typing import List, Tuple, Union
 
+from python.grid import Grid
 from python.util import run_solution
 
 
-Seafloor = List[List[str]]
+Seafloor = Union[List[List[str]], Grid]
 
 
 EAST_FACING = ">"
@@ -12,8 +13,12 @@ SOUTH_FACING = "v"
 VACANT = "."
 
 
-def parse_seafloor(input: str) -> Seafloor:
-    """..."""
+def parse_seafloor(input: str, *, compact: bool = False) -> Seafloor:
+    """Return the seafloor of the specified 'input', as a wrapping 'Grid' of
+    character bytes if 'compact' is set, and as a list of rows otherwise."""
+
+    if compact:
+        return Grid.from_chars(input, wraparound=True)
 
     return [list(line) for line in input.splitlines()]
 
@@ -72,11 +77,56 @@ def try_move_sea_cucumbers(seafloor: Seafloor, *, herd: str) -> Tuple[Seafloor,
     return new_seafloor, True
 
 
+def try_move_compact_sea_cucumbers(seafloor: Grid, *, herd: str) -> Tuple[Grid, bool]:
+    """Move, in place, every sea cucumber of the specified 'herd' on the
+    specified 'seafloor' whose next step is vacant."""
+
+    cells = seafloor.cells
+    herd_code = ord(herd)
+    vacant_code = ord(VACANT)
+
+    # Steps wrap from the last column to the first, and from the last row to
+    # the first, of the flat cells.
+    num_cells = len(cells)
+    num_cols = seafloor.stride
+
+    if herd == EAST_FACING:
+        steps = [
+            (idx, idx + 1 - num_cols if (idx + 1) % num_cols == 0 else idx + 1)
+            for idx, code in enumerate(cells)
+            if code == herd_code
+        ]
+    else:
+        steps = [
+            (idx, (idx + num_cols) % num_cells)
+            for idx, code in enumerate(cells)
+            if code == herd_code
+        ]
+
+    moves = [
+        (old_idx, new_idx)
+        for old_idx, new_idx in steps
+        if cells[new_idx] == vacant_code
+    ]
+
+    for old_idx, new_idx in moves:
+        cells[old_idx] = vacant_code
+        cells[new_idx] = herd_code
+
+    return seafloor, bool(moves)
+
+
 def try_perform_step(seafloor: Seafloor):
     """..."""
 
-    seafloor, east_herd_has_moved = try_move_sea_cucumbers(seafloor, herd=EAST_FACING)
-    seafloor, south_herd_has_moved = try_move_sea_cucumbers(seafloor, herd=SOUTH_FACING)
+    try_move = (
+        try_move_compact_sea_cucumbers
+        if isinstance(seafloor, Grid)
+        else try_move_sea_cucumbers
+    )
+
+    seafloor, east_herd_has_moved = try_move(seafloor, herd=EAST_FACING)
+    seafloor, south_herd_has_moved = try_move(seafloor, herd=SOUTH_FACING)
 
     has_moved = east_herd_has_moved or south_herd_has_moved
 
@@ -86,7 +136,7 @@ def try_perform_step(seafloor: Seafloor):
 def part1(input: str) -> int:
     """..."""
 
-    seafloor = parse_seafloor(input)
+    seafloor = parse_seafloor(input, compact=True)
 
     has_changed = True
     num_steps = 0
@@ -1,12 +1,22 @@
+import itertools
+import operator
 import sys
-from typing import List, Tuple
+from array import array
+from collections import defaultdict
+from typing import Dict, Generator, List, NamedTuple, Optional, Set, Tuple
 
+from python.parse import DEFAULT_TYPECODE, parse_int_list, parse_ints
 from python.util import run_solution
 
 
 Board = List[List[int]]
 
 
+# The board of a cell, and the indices of the counters of its row and column
+# across all boards.
+Location = Tuple[int, int, int]
+
+
 def parse_board(input: str) -> Board:
     """..."""
 
@@ -41,41 +51,243 @@ def apply_number_to_board(number: int, board: Board) -> Board:
     return [[entry if entry != number else None for entry in line] for line in board]
 
 
+class BoardTensor(NamedTuple):
+    """Boards of one shape, stored as a flat '(num_boards, num_rows, num_cols)'
+    tensor in row-major order: the cell at row 'r' and column 'c' of board 'b'
+    is at index '(b * num_rows + r) * num_cols + c' of 'entries'."""
+
+    num_boards: int
+    num_rows: int
+    num_cols: int
+    entries: array
+
+
+class Ranking(NamedTuple):
+    """The outcome of drawing numbers for every board at once.  'win_times'
+    and 'scores' hold, for each board, the index of the draw that wins it and
+    its score, or 'None' if it never wins, and 'finishing_order' lists the
+    boards that win, in the order that they win."""
+
+    finishing_order: List[int]
+    win_times: List[Optional[int]]
+    scores: List[Optional[int]]
+
+
+def parse_board_tensor(input: str) -> Tuple[List[int], BoardTensor]:
+    """Return the numbers to draw and the boards of the specified 'input', as
+    for 'parse_input', with the boards as one tensor.  Every board must have
+    the shape of the first, which need not be 5x5."""
+
+    numbers_line, _, boards_input = input.strip().partition("\n\n")
+    numbers = parse_int_list(numbers_line)
+
+    first_board = boards_input.split("\n\n", 1)[0].splitlines()
+    num_rows = len(first_board)
+    num_cols = len(first_board[0].split()) if first_board else 0
+
+    num_boards = boards_input.count("\n\n") + 1 if boards_input else 0
+    entries = parse_ints(boards_input, separators=b"")
+    assert len(entries) == num_boards * num_rows * num_cols, (
+        f"Expected {num_boards} boards of {num_rows}x{num_cols} entries, "
+        f"got {len(entries)} entries"
+    )
+
+    return numbers, BoardTensor(
+        num_boards=num_boards, num_rows=num_rows, num_cols=num_cols, entries=entries
+    )
+
+
+def rank_boards(numbers: List[int], boards: BoardTensor) -> Ranking:
+    """Return the ranking of the specified 'boards' when drawing the specified
+    'numbers' in order, without simulating the draws.  Each entry is replaced
+    by the index of the draw of its number, so a line is complete at the
+    largest index in it, and a board wins at the smallest of these over its
+    rows and columns.  Each cell of every board is one strided slice of the
+    tensor, so the maxima, minima and scores are computed across all boards
+    at once, one cell at a time.  Boards that win with the same draw finish
+    in board order, as in 'winning_scores'."""
+
+    never = len(numbers)
+    draw_idxs: Dict[int, int] = {}
+    for draw_idx, number in enumerate(numbers):
+        draw_idxs.setdefault(number, draw_idx)
+
+    num_cells = boards.num_rows * boards.num_cols
+    ranks = array(
+        DEFAULT_TYPECODE,
+        map(draw_idxs.get, boards.entries, itertools.repeat(never)),
+    )
+
+    # The entries and ranks of each cell, across all boards.
+    cell_entries = [boards.entries[cell::num_cells] for cell in range(num_cells)]
+    cell_ranks = [ranks[cell::num_cells] for cell in range(num_cells)]
+
+    # The extra neutral argument keeps 'max' and 'min' elementwise even for
+    # lines of a single cell.
+    row_completions = [
+        map(
+            max,
+            *cell_ranks[row * boards.num_cols : (row + 1) * boards.num_cols],
+            itertools.repeat(-1),
+        )
+        for row in range(boards.num_rows)
+    ]
+    col_completions = [
+        map(max, *cell_ranks[col :: boards.num_cols], itertools.repeat(-1))
+        for col in range(boards.num_cols)
+    ]
+    win_times = list(
+        map(min, *row_completions, *col_completions, itertools.repeat(never))
+    )
+
+    # Sum the entries that are still unchecked when each board wins.
+    unchecked_sums = [0] * boards.num_boards
+    for entries, entry_ranks in zip(cell_entries, cell_ranks):
+        is_unchecked = map(operator.gt, entry_ranks, win_times)
+        unchecked = map(operator.mul, entries, is_unchecked)
+        unchecked_sums = list(map(operator.add, unchecked_sums, unchecked))
+
+    finishing_order = sorted(
+        (board_idx for board_idx, win_time in enumerate(win_times) if win_time < never),
+        key=win_times.__getitem__,
+    )
+
+    scores: List[Optional[int]] = [None] * boards.num_boards
+    for board_idx in finishing_order:
+        scores[board_idx] = numbers[win_times[board_idx]] * unchecked_sums[board_idx]
+
+    return Ranking(
+        finishing_order=finishing_order,
+        win_times=[None if win_time == never else win_time for win_time in win_times],
+        scores=scores,
+    )
+
+
 def sum_of_unchecked(board: Board) -> int:
     """..."""
 
     return sum(entry for line in board for entry in line if entry is not None)
 
 
-def part1(input: str) -> int:
-    """..."""
+class BingoIndex:
+    """An index from each number to the locations of its cells on every board,
+    with a count of the marked cells in each row and column of each board.  A
+    draw then only touches the cells with the drawn number, and finds each
+    win from a single counter, rather than rescanning every board.  The
+    counters of all boards share flat lists, so that a location is a plain
+    tuple of indices into them."""
 
-    numbers, boards = parse_input(input)
+    def __init__(self, boards: List[Board]) -> None:
+        """..."""
 
-    for number in numbers:
-        boards = [apply_number_to_board(number, board) for board in boards]
-        for board in boards:
-            if board_has_bingo(board):
-                return number * sum_of_unchecked(board)
+        self.locations: Dict[int, List[Location]] = defaultdict(list)
 
+        # The number of cells to mark in each row and column, to complete it.
+        self.row_sizes: List[int] = []
+        self.col_sizes: List[int] = []
 
-def part2(input: str) -> int:
-    """..."""
+        for board_idx, board in enumerate(boards):
+            num_rows, num_cols = len(board), len(board[0])
+            row_offset, col_offset = len(self.row_sizes), len(self.col_sizes)
+            self.row_sizes.extend([num_cols] * num_rows)
+            self.col_sizes.extend([num_rows] * num_cols)
+
+            for row_idx, line in enumerate(board):
+                for col_idx, entry in enumerate(line):
+                    self.locations[entry].append(
+                        (board_idx, row_offset + row_idx, col_offset + col_idx)
+                    )
 
-    numbers, boards = parse_input(input)
+        self.row_hits = [0] * len(self.row_sizes)
+        self.col_hits = [0] * len(self.col_sizes)
+
+        self.unchecked_sums = list(map(sum_of_unchecked, boards))
+        self.has_won = [False] * len(boards)
+        self.drawn: Set[int] = set()
+
+    def draw(self, number: int) -> List[int]:
+        """Mark every cell with the specified 'number', and return the indices
+        of the boards that win with this draw, in increasing order."""
+
+        if number in self.drawn:
+            return []
+
+        self.drawn.add(number)
+
+        row_hits, col_hits = self.row_hits, self.col_hits
+        unchecked_sums, has_won = self.unchecked_sums, self.has_won
+
+        winners = []
+        for board_idx, row, col in self.locations.get(number, ()):
+            unchecked_sums[board_idx] -= number
+            row_hits[row] += 1
+            col_hits[col] += 1
+
+            if has_won[board_idx]:
+                continue
+
+            if (
+                row_hits[row] == self.row_sizes[row]
+                or col_hits[col] == self.col_sizes[col]
+            ):
+                has_won[board_idx] = True
+                winners.append(board_idx)
+
+        return winners
+
+
+def winning_scores_by_rescan(
+    numbers: List[int], boards: List[Board]
+) -> Generator[int, None, None]:
+    """Yield the same scores as 'winning_scores', by applying each number to
+    every board and then rescanning every board that has not won yet."""
 
     board_idxs = set(range(len(boards)))
 
     for number in numbers:
         boards = [apply_number_to_board(number, board) for board in boards]
         for idx, board in enumerate(boards):
-            if idx not in board_idxs:
-                continue
-
-            if board_has_bingo(board):
+            if idx in board_idxs and board_has_bingo(board):
                 board_idxs.remove(idx)
-                if not board_idxs:
-                    return number * sum_of_unchecked(board)
+                yield number * sum_of_unchecked(board)
+
+
+def winning_scores(
+    numbers: List[int], boards: List[Board]
+) -> Generator[int, None, None]:
+    """Yield the score of each board of the specified 'boards' as it wins,
+    drawing the specified 'numbers' in order.  Boards that win with the same
+    draw are yielded in order."""
+
+    index = BingoIndex(boards)
+
+    for number in numbers:
+        for board_idx in index.draw(number):
+            yield number * index.unchecked_sums[board_idx]
+
+
+def part1(input: str) -> Optional[int]:
+    """..."""
+
+    ranking = rank_boards(*parse_board_tensor(input))
+
+    # As before, there is no answer if no board ever wins.
+    if not ranking.finishing_order:
+        return None
+
+    return ranking.scores[ranking.finishing_order[0]]
+
+
+def part2(input: str) -> Optional[int]:
+    """..."""
+
+    ranking = rank_boards(*parse_board_tensor(input))
+
+    # As before, there is no answer unless every board eventually wins.
+    if len(ranking.finishing_order) < len(ranking.win_times):
+        return None
+
+    return ranking.scores[ranking.finishing_order[-1]]
 
 
 if __name__ == "__main__":
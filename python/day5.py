@@ -1,38 +1,47 @@
-import re
+import collections
 import sys
-from typing import Generator, List, NamedTuple, Set, Tuple
+from array import array
+from typing import Counter, Generator, List, NamedTuple, Set, Tuple
 
-from python.util import run_solution
+from python.parse import iter_records, parse_segments
+from python.util import cached_parser, run_solution
 
 
-class Point(NamedTuple):
-    x: int
-    y: int
+# The largest bounding box, in cells, that is rasterised densely, at one byte
+# per cell.  Vents spread over a larger box are counted sparsely instead.
+MAX_DENSE_CELLS = 1 << 27
 
+# Map the count of vents over a cell to the count after one more vent, which
+# saturates at 2, as only whether a cell has at least two vents matters.
+INCREMENT_COUNTS = bytes([1, 2] + [2] * 254)
 
-Vent = Tuple[Point, Point]
+# The flat start, stop and step of the cells covered by a segment, as a slice.
+CellSlice = Tuple[int, int, int]
 
 
-def parse_vent(line: str) -> Vent:
-    """..."""
+class BoundingBox(NamedTuple):
+    min_x: int
+    min_y: int
+    width: int
+    height: int
 
-    pattern = re.compile("(?P<x1>\d+),(?P<y1>\d+) -> (?P<x2>\d+),(?P<y2>\d+)")
 
-    match = pattern.match(line)
-    assert match, f"Cannot recognise line: {line}"
+class Point(NamedTuple):
+    x: int
+    y: int
 
-    groupdict = match.groupdict()
 
-    return (
-        Point(x=int(groupdict["x1"]), y=int(groupdict["y1"])),
-        Point(x=int(groupdict["x2"]), y=int(groupdict["y2"])),
-    )
+Vent = Tuple[Point, Point]
 
 
+@cached_parser
 def parse_vents(input: str) -> List[Vent]:
     """..."""
 
-    return list(map(parse_vent, input.splitlines()))
+    return [
+        (Point(x=x1, y=y1), Point(x=x2, y=y2))
+        for x1, y1, x2, y2 in iter_records(parse_segments(input), num_fields=4)
+    ]
 
 
 def is_horizontal(start: Point, end: Point) -> bool:
@@ -101,18 +110,117 @@ def find_intersections(vents: List[Vent], *, ignore_diagonals: bool) -> Set[Poin
     return points_with_at_least_two_overlaps
 
 
+@cached_parser
+def parse_vent_segments(input: str) -> array:
+    """Return the vents of the specified 'input' as the flat records of
+    'parse_segments', with 'x1, y1, x2, y2' for each vent."""
+
+    return parse_segments(input)
+
+
+def bounding_box(segments: array) -> BoundingBox:
+    """..."""
+
+    if not segments:
+        return BoundingBox(min_x=0, min_y=0, width=0, height=0)
+
+    xs = segments[0::4] + segments[2::4]
+    ys = segments[1::4] + segments[3::4]
+    min_x, min_y = min(xs), min(ys)
+
+    return BoundingBox(
+        min_x=min_x, min_y=min_y, width=max(xs) - min_x + 1, height=max(ys) - min_y + 1
+    )
+
+
+def cell_slices(
+    segments: array, box: BoundingBox, *, ignore_diagonals: bool
+) -> Generator[CellSlice, None, None]:
+    """Yield the cells covered by each of the specified 'segments', as a
+    slice of the row-major raster of the specified 'box'.  The cells of a
+    horizontal, vertical or diagonal vent are evenly spaced in the raster, so
+    each vent is one slice, with a positive step so that its stop never wraps
+    around to the end of the raster."""
+
+    for x1, y1, x2, y2 in iter_records(segments, num_fields=4):
+        delta_x = (x2 > x1) - (x2 < x1)
+        delta_y = (y2 > y1) - (y2 < y1)
+
+        if delta_x and delta_y:
+            if ignore_diagonals:
+                continue
+
+            assert abs(x2 - x1) == abs(y2 - y1), (
+                f"Expected vent {x1},{y1} -> {x2},{y2} to be horizontal, vertical "
+                "or diagonal"
+            )
+
+        num_cells = max(abs(x2 - x1), abs(y2 - y1)) + 1
+        start = (y1 - box.min_y) * box.width + (x1 - box.min_x)
+        step = delta_y * box.width + delta_x
+
+        if step < 0:
+            start, step = start + (num_cells - 1) * step, -step
+
+        yield start, start + (num_cells - 1) * step + 1, step or 1
+
+
+def count_overlaps_dense(segments: array, *, ignore_diagonals: bool) -> int:
+    """Return the number of cells covered by at least two of the specified
+    'segments', by rasterising them into one byte per cell of their bounding
+    box.  Each vent increments its cells with one 'translate' of one slice."""
+
+    box = bounding_box(segments)
+    raster = bytearray(box.width * box.height)
+
+    for start, stop, step in cell_slices(
+        segments, box, ignore_diagonals=ignore_diagonals
+    ):
+        raster[start:stop:step] = raster[start:stop:step].translate(INCREMENT_COUNTS)
+
+    return raster.count(2)
+
+
+def count_overlaps_sparse(segments: array, *, ignore_diagonals: bool) -> int:
+    """Return the same count as 'count_overlaps_dense', in memory that grows
+    with the number of covered cells rather than with the bounding box, by
+    counting the flat index of every covered cell in a hash table."""
+
+    box = bounding_box(segments)
+    counts: Counter[int] = collections.Counter()
+
+    for start, stop, step in cell_slices(
+        segments, box, ignore_diagonals=ignore_diagonals
+    ):
+        counts.update(range(start, stop, step))
+
+    return sum(map((2).__le__, counts.values()))
+
+
+def count_overlaps(segments: array, *, ignore_diagonals: bool) -> int:
+    """Return the number of cells covered by at least two of the specified
+    'segments', rasterising densely unless their bounding box has more than
+    'MAX_DENSE_CELLS' cells."""
+
+    box = bounding_box(segments)
+    if box.width * box.height > MAX_DENSE_CELLS:
+        return count_overlaps_sparse(segments, ignore_diagonals=ignore_diagonals)
+
+    return count_overlaps_dense(segments, ignore_diagonals=ignore_diagonals)
+
+
 def part1(input: str) -> int:
     """..."""
 
-    vents = parse_vents(input)
-    return len(find_intersections(vents, ignore_diagonals=True))
+    segments = parse_vent_segments(input)
+    return count_overlaps(segments, ignore_diagonals=True)
 
 
 def part2(input: str) -> int:
     """..."""
 
-    vents = parse_vents(input)
-    return len(find_intersections(vents, ignore_diagonals=False))
+    segments = parse_vent_segments(input)
+    return count_overlaps(segments, ignore_diagonals=False)
 
 
 if __name__ == "__main__":
@@ -2,7 +2,8 @@ import functools
 import sys
 from typing import List
 
-from python.util import run_solution
+from python.parse import parse_int_list
+from python.util import INSTRUMENTATION, run_solution
 
 
 Timer = int
@@ -11,7 +12,7 @@ Timer = int
 def parse_timers(line: str) -> List[Timer]:
     """..."""
 
-    return list(map(int, line.split(",")))
+    return parse_int_list(line)
 
 
 @functools.lru_cache(maxsize=None)
@@ -34,7 +35,18 @@ def fish_count(initial_timer: int, *, num_days: int) -> int:
 def simulate(timers: List[int], *, num_days: int) -> int:
     """..."""
 
-    return sum(fish_count(timer, num_days=num_days) for timer in timers)
+    cache_info_before = fish_count.cache_info()
+    num_fish = sum(fish_count(timer, num_days=num_days) for timer in timers)
+    cache_info_after = fish_count.cache_info()
+
+    INSTRUMENTATION.count(
+        "day6.fish_count.hits", cache_info_after.hits - cache_info_before.hits
+    )
+    INSTRUMENTATION.count(
+        "day6.fish_count.misses", cache_info_after.misses - cache_info_before.misses
+    )
+
+    return num_fish
 
 
 def part1(input: str) -> int:
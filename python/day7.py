@@ -1,13 +1,14 @@
 import sys
 from typing import Callable, List
 
+from python.parse import parse_int_list
 from python.util import run_solution
 
 
 def parse_crabs(input: str) -> List[int]:
     """..."""
 
-    return list(map(int, input.split(",")))
+    return parse_int_list(input)
 
 
 def uniform_fuel(positions: List[int], common_pos: int) -> int:
@@ -1,21 +1,27 @@
 import functools
 import sys
 from collections import deque
-from typing import Generator, List, Set, Tuple
+from typing import Generator, List, Set, Tuple, Union
 
+from python.grid import Grid as CompactGrid
+from python.parse import parse_digit_grid, parse_digit_rows
 from python.util import run_solution
 
 
 MAX_HEIGHT = 9
 
-Grid = List[List[int]]
+Grid = Union[List[List[int]], CompactGrid]
 Point = Tuple[int, int]
 
 
-def parse_grid(input: str) -> Grid:
-    """..."""
+def parse_grid(input: str, *, compact: bool = False) -> Grid:
+    """Return the grid of the specified 'input', as a 'CompactGrid' with one
+    byte per cell if 'compact' is set, and as a list of rows otherwise."""
+
+    if compact:
+        return parse_digit_grid(input)
 
-    return [list(map(int, line)) for line in input.splitlines()]
+    return parse_digit_rows(input)
 
 
 def dimensions(grid: Grid) -> Tuple[int, int]:
@@ -74,23 +80,60 @@ def find_basin(grid: Grid, root_x: int, root_y: int) -> Set[Point]:
     return basin
 
 
+def find_lowest_cells(grid: CompactGrid) -> List[int]:
+    """Return the indices of the lowest points of the specified 'grid', read
+    straight from its flat cells with 'CompactGrid.neighbours' rather than
+    bounds-checking a tuple per neighbour."""
+
+    cells = grid.cells
+    neighbours = grid.neighbours
+
+    return [
+        index
+        for index, height in enumerate(cells)
+        if all(height < cells[neighbour] for neighbour in neighbours(index))
+    ]
+
+
+def find_basin_cells(grid: CompactGrid, root: int) -> Set[int]:
+    """Return the indices of the basin of the specified 'grid' that flows down
+    to the cell at the specified 'root' index, as for 'find_basin'."""
+
+    cells = grid.cells
+    neighbours = grid.neighbours
+
+    basin: Set[int] = set()
+    candidates = deque([root])
+
+    while candidates:
+        index = candidates.popleft()
+        basin.add(index)
+
+        height = cells[index]
+        for neighbour in neighbours(index):
+            if height < cells[neighbour] < MAX_HEIGHT:
+                candidates.append(neighbour)
+
+    return basin
+
+
 def part1(input: str) -> int:
     """..."""
 
-    grid = parse_grid(input)
+    grid = parse_grid(input, compact=True)
 
-    lowest_points = find_lowest_points(grid)
-    return sum(grid[x][y] for x, y in lowest_points) + len(lowest_points)
+    lowest_cells = find_lowest_cells(grid)
+    return sum(grid.cells[index] for index in lowest_cells) + len(lowest_cells)
 
 
 def part2(input: str) -> int:
     """..."""
 
-    grid = parse_grid(input)
+    grid = parse_grid(input, compact=True)
 
-    lowest_points = find_lowest_points(grid)
+    lowest_cells = find_lowest_cells(grid)
     basin_sizes = sorted(
-        (len(find_basin(grid, *point)) for point in lowest_points), reverse=True
+        (len(find_basin_cells(grid, index)) for index in lowest_cells), reverse=True
     )
 
     return functools.reduce(lambda x, y: x * y, basin_sizes[:3])
@@ -0,0 +1,29 @@
+import importlib
+import random
+from typing import Callable
+
+
+DAYS = list(range(1, 26))
+
+InputGenerator = Callable[..., str]
+
+
+def load_generator(day: int) -> InputGenerator:
+    """Return the 'generate' function of the 'python.gen.dayN' module for the
+    specified 'day'."""
+
+    assert day in DAYS, f"Day ({day}) must be one of {DAYS}"
+
+    module = importlib.import_module(f"python.gen.day{day}")
+    return module.generate
+
+
+def generate(day: int, size: int, *, seed: int = 0) -> str:
+    """Return a synthetic input for the specified 'day', scaled to the
+    specified 'size'.  What 'size' measures is specific to each day (e.g. the
+    number of readings for day 1, or the side of the grid for day 15).  The
+    same 'day', 'size' and 'seed' always produce the same input."""
+
+    assert size > 0, f"Size ({size}) must be positive"
+
+    return load_generator(day)(size, rng=random.Random(seed))
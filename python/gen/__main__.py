@@ -0,0 +1,37 @@
+import argparse
+import sys
+from pathlib import Path
+from typing import List
+
+from python.gen import DAYS, generate
+
+
+def parse_args(args: List[str]) -> argparse.Namespace:
+    """..."""
+
+    parser = argparse.ArgumentParser(prog="python -m python.gen")
+    parser.add_argument("--day", type=int, choices=DAYS, required=True)
+    parser.add_argument("--size", type=int, required=True)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path)
+
+    return parser.parse_args(args)
+
+
+def main(args: List[str]) -> int:
+    """..."""
+
+    parsed_args = parse_args(args)
+
+    input = generate(parsed_args.day, parsed_args.size, seed=parsed_args.seed)
+
+    if parsed_args.output is None:
+        sys.stdout.write(input)
+    else:
+        parsed_args.output.write_text(input)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
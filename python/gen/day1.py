@@ -0,0 +1,13 @@
+import random
+
+
+def generate(size: int, *, rng: random.Random) -> str:
+    """Return 'size' sonar sweep depths, as a random walk that drifts deeper."""
+
+    depths = []
+    depth = rng.randint(100, 200)
+    for _ in range(size):
+        depth = max(0, depth + rng.randint(-8, 12))
+        depths.append(depth)
+
+    return "\n".join(map(str, depths))
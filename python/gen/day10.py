@@ -0,0 +1,36 @@
+import random
+
+
+OPENING_TO_CLOSING = {"(": ")", "[": "]", "{": "}", "<": ">"}
+
+
+def generate(size: int, *, rng: random.Random) -> str:
+    """Return 'size' lines of chunks, where about half of the lines are
+    corrupt and the rest (including the first) are incomplete."""
+
+    lines = []
+    for line_idx in range(size):
+        is_corrupt = line_idx > 0 and rng.random() < 0.5
+        length = rng.randint(20, 100)
+
+        chars = []
+        stack = []
+        while len(chars) < length or not stack:
+            if stack and rng.random() < 0.45:
+                chars.append(OPENING_TO_CLOSING[stack.pop()])
+            else:
+                opening = rng.choice(list(OPENING_TO_CLOSING))
+                stack.append(opening)
+                chars.append(opening)
+
+        if is_corrupt:
+            expected = OPENING_TO_CLOSING[stack[-1]]
+            chars.append(
+                rng.choice(
+                    [char for char in OPENING_TO_CLOSING.values() if char != expected]
+                )
+            )
+
+        lines.append("".join(chars))
+
+    return "\n".join(lines)
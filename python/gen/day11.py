@@ -0,0 +1,11 @@
+import random
+
+
+def generate(size: int, *, rng: random.Random) -> str:
+    """Return a 'size' x 'size' grid of energy levels.  Note that part 2 only
+    terminates once every octopus flashes at once, which random grids are not
+    guaranteed to do."""
+
+    return "\n".join(
+        "".join(str(rng.randint(0, 9)) for _ in range(size)) for _ in range(size)
+    )
@@ -0,0 +1,44 @@
+import random
+import string
+
+
+def cave_name(idx: int, *, big: bool) -> str:
+    """..."""
+
+    letters = string.ascii_uppercase if big else string.ascii_lowercase
+
+    name = ""
+    while True:
+        idx, remainder = divmod(idx, len(letters))
+        name += letters[remainder]
+        if idx == 0:
+            return name
+
+
+def generate(size: int, *, rng: random.Random) -> str:
+    """Return a cave system with 'size' small caves and about a third as many
+    big caves.  Big caves are never connected to each other, as the number of
+    paths would be infinite.  The number of paths grows exponentially with
+    'size', so keep it small."""
+
+    # Skip the names that are reserved for the terminal caves.
+    small_caves = [
+        name
+        for name in (cave_name(idx, big=False) for idx in range(size + 2))
+        if name not in ("start", "end")
+    ][:size]
+    big_caves = [cave_name(idx, big=True) for idx in range(max(1, size // 3))]
+
+    passages = set()
+    for cave in small_caves:
+        passages.add((cave, rng.choice(big_caves)))
+        if rng.random() < 0.5:
+            other = rng.choice(small_caves)
+            if other != cave:
+                passages.add((cave, other))
+
+    for terminal in ["start", "end"]:
+        passages.add((terminal, rng.choice(big_caves)))
+        passages.add((terminal, rng.choice(small_caves)))
+
+    return "\n".join(f"{cave}-{other}" for cave, other in sorted(passages))
@@ -0,0 +1,35 @@
+import random
+from typing import List, Set, Tuple
+
+
+def generate(size: int, *, rng: random.Random) -> str:
+    """Return 'size' dots on a sheet that folds, alternately along 'x' and
+    'y', down to a 40x6 code.  Each fold is along the exact middle of the
+    sheet, and no dot lies on a fold line."""
+
+    width, height = 40, 6
+    folds: List[Tuple[str, int]] = []
+    while width * height < 2 * size:
+        if len(folds) % 2 == 0:
+            folds.append(("x", width))
+            width = 2 * width + 1
+        else:
+            folds.append(("y", height))
+            height = 2 * height + 1
+
+    fold_lines = {
+        axis: {value for fold_axis, value in folds if fold_axis == axis}
+        for axis in "xy"
+    }
+
+    dots: Set[Tuple[int, int]] = set()
+    while len(dots) < size:
+        x = rng.randrange(width)
+        y = rng.randrange(height)
+        if x not in fold_lines["x"] and y not in fold_lines["y"]:
+            dots.add((x, y))
+
+    # The largest fold comes first.
+    instructions = [f"fold along {axis}={value}" for axis, value in reversed(folds)]
+
+    return "\n".join([f"{x},{y}" for x, y in sorted(dots)] + [""] + instructions)
@@ -0,0 +1,18 @@
+import random
+
+
+ELEMENTS = "BCFHKNOPSV"
+
+
+def generate(size: int, *, rng: random.Random) -> str:
+    """Return a polymer template of 'size' elements, and an insertion rule
+    for every pair of elements."""
+
+    template = "".join(rng.choice(ELEMENTS) for _ in range(size))
+    rules = [
+        f"{first}{second} -> {rng.choice(ELEMENTS)}"
+        for first in ELEMENTS
+        for second in ELEMENTS
+    ]
+
+    return "\n".join([template, ""] + rules)
@@ -0,0 +1,9 @@
+import random
+
+
+def generate(size: int, *, rng: random.Random) -> str:
+    """Return a 'size' x 'size' grid of risk levels."""
+
+    return "\n".join(
+        "".join(str(rng.randint(1, 9)) for _ in range(size)) for _ in range(size)
+    )
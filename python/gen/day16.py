@@ -0,0 +1,71 @@
+import random
+from typing import List
+
+
+LITERAL_TYPE_ID = 4
+OPERATOR_TYPE_IDS = [0, 1, 2, 3, 5, 6, 7]
+COMPARISON_TYPE_IDS = [5, 6, 7]
+
+
+def encode_literal(value: int) -> str:
+    """Return the bits of the specified 'value', in groups of four prefixed
+    by whether another group follows."""
+
+    bits = format(value, "b")
+    bits = bits.zfill(-(-len(bits) // 4) * 4)
+    groups = [bits[idx : idx + 4] for idx in range(0, len(bits), 4)]
+
+    return "".join(
+        ("1" if idx < len(groups) - 1 else "0") + group
+        for idx, group in enumerate(groups)
+    )
+
+
+def encode_packet(num_packets: int, *, rng: random.Random) -> str:
+    """Return the bits of a random packet with 'num_packets' packets in total,
+    including itself."""
+
+    version = format(rng.randrange(8), "03b")
+
+    if num_packets == 1:
+        literal = encode_literal(rng.randrange(1 << rng.randint(1, 16)))
+        return version + format(LITERAL_TYPE_ID, "03b") + literal
+
+    # Comparisons need exactly two subpackets.
+    type_ids = OPERATOR_TYPE_IDS
+    if num_packets == 2:
+        type_ids = [
+            type_id for type_id in type_ids if type_id not in COMPARISON_TYPE_IDS
+        ]
+
+    type_id = rng.choice(type_ids)
+    num_subpackets = 2 if type_id in COMPARISON_TYPE_IDS else rng.randint(1, 4)
+    num_subpackets = min(num_subpackets, num_packets - 1)
+
+    # Split the remaining packets between the subpackets.
+    remaining = num_packets - 1 - num_subpackets
+    cuts = sorted(rng.randint(0, remaining) for _ in range(num_subpackets - 1))
+    sizes = [
+        1 + upper - lower for lower, upper in zip([0] + cuts, cuts + [remaining])
+    ]
+
+    subpackets: List[str] = [encode_packet(size, rng=rng) for size in sizes]
+    payload = "".join(subpackets)
+
+    if rng.random() < 0.5 and len(payload) < 1 << 15:
+        length = "0" + format(len(payload), "015b")
+    else:
+        length = "1" + format(len(subpackets), "011b")
+
+    return version + format(type_id, "03b") + length + payload
+
+
+def generate(size: int, *, rng: random.Random) -> str:
+    """Return a hexadecimal transmission holding 'size' packets in total."""
+
+    bits = encode_packet(size, rng=rng)
+    bits += "0" * (-len(bits) % 4)
+
+    return "".join(
+        format(int(bits[idx : idx + 4], 2), "X") for idx in range(0, len(bits), 4)
+    )
@@ -0,0 +1,14 @@
+import random
+
+
+def generate(size: int, *, rng: random.Random) -> str:
+    """Return a target area about 'size' units to the right of, and below,
+    the launcher.  The number of candidate velocities grows with 'size'
+    squared."""
+
+    x_min = rng.randint(size, 2 * size)
+    x_max = x_min + rng.randint(1, max(1, size // 2))
+    y_min = -rng.randint(size, 2 * size)
+    y_max = y_min + rng.randint(1, max(1, size // 2))
+
+    return f"target area: x={x_min}..{x_max}, y={y_min}..{min(y_max, -1)}"
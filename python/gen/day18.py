@@ -0,0 +1,21 @@
+import random
+
+
+def snailfish_number(*, depth: int, rng: random.Random) -> str:
+    """Return a reduced snailfish pair nested inside 'depth' other pairs."""
+
+    elements = []
+    for _ in range(2):
+        if depth < 3 and rng.random() < 0.6:
+            elements.append(snailfish_number(depth=depth + 1, rng=rng))
+        else:
+            elements.append(str(rng.randint(0, 9)))
+
+    return f"[{elements[0]},{elements[1]}]"
+
+
+def generate(size: int, *, rng: random.Random) -> str:
+    """Return 'size' reduced snailfish numbers, i.e. with no pair nested
+    inside four pairs and no regular number above 9."""
+
+    return "\n".join(snailfish_number(depth=0, rng=rng) for _ in range(size))
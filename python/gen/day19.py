@@ -0,0 +1,70 @@
+import random
+from typing import List, Set
+
+from python.day19 import ROTATION_MATRICES, Point
+
+
+SCANNER_RANGE = 1000
+BEACONS_PER_SCANNER = 25
+OVERLAP = 12
+
+
+def random_point(center: Point, *, radius: int, rng: random.Random) -> Point:
+    """..."""
+
+    return Point(
+        x=center.x + rng.randint(-radius, radius),
+        y=center.y + rng.randint(-radius, radius),
+        z=center.z + rng.randint(-radius, radius),
+    )
+
+
+def in_range(scanner: Point, beacon: Point) -> bool:
+    """..."""
+
+    return all(abs(value) <= SCANNER_RANGE for value in beacon - scanner)
+
+
+def generate(size: int, *, rng: random.Random) -> str:
+    """Return the reports of 'size' scanners, each at a random orientation.
+    Scanners are placed along a chain, where consecutive scanners share at
+    least 12 beacons, so that every scanner can be aligned with scanner 0."""
+
+    scanners: List[Point] = [Point(0, 0, 0)]
+    for _ in range(size - 1):
+        scanners.append(random_point(scanners[-1], radius=600, rng=rng))
+
+    beacons: Set[Point] = set()
+    for scanner, next_scanner in zip(scanners, scanners[1:]):
+        # Place the shared beacons in the overlap of both scanners' ranges.
+        lower = [max(a, b) - SCANNER_RANGE for a, b in zip(scanner, next_scanner)]
+        upper = [min(a, b) + SCANNER_RANGE for a, b in zip(scanner, next_scanner)]
+        shared = sum(
+            in_range(scanner, beacon) and in_range(next_scanner, beacon)
+            for beacon in beacons
+        )
+        while shared < OVERLAP:
+            beacon = Point(*(rng.randint(low, high) for low, high in zip(lower, upper)))
+            if beacon not in beacons:
+                beacons.add(beacon)
+                shared += 1
+
+    for scanner in scanners:
+        for _ in range(BEACONS_PER_SCANNER - OVERLAP):
+            beacons.add(random_point(scanner, radius=SCANNER_RANGE, rng=rng))
+
+    reports = []
+    for scanner_id, scanner in enumerate(scanners):
+        rotation = rng.choice(ROTATION_MATRICES)
+        visible = [
+            rotation(beacon - scanner)
+            for beacon in beacons
+            if in_range(scanner, beacon)
+        ]
+        rng.shuffle(visible)
+
+        lines = [f"--- scanner {scanner_id} ---"]
+        lines.extend(f"{beacon.x},{beacon.y},{beacon.z}" for beacon in visible)
+        reports.append("\n".join(lines))
+
+    return "\n\n".join(reports)
@@ -0,0 +1,27 @@
+import random
+
+
+def generate(size: int, *, rng: random.Random) -> str:
+    """Return 'size' commands, none of which take the submarine above the
+    surface."""
+
+    commands = []
+    depth = 0
+    for _ in range(size):
+        direction = rng.choice(["forward", "down", "up"])
+        magnitude = rng.randint(1, 9)
+
+        if direction == "up":
+            if depth == 0:
+                direction = "down"
+            else:
+                magnitude = min(magnitude, depth)
+
+        if direction == "down":
+            depth += magnitude
+        elif direction == "up":
+            depth -= magnitude
+
+        commands.append(f"{direction} {magnitude}")
+
+    return "\n".join(commands)
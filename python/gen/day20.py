@@ -0,0 +1,17 @@
+import random
+
+
+def generate(size: int, *, rng: random.Random) -> str:
+    """Return an enhancement algorithm and a 'size' x 'size' image.  Half of
+    the algorithms light up the infinite background on odd steps, as the
+    puzzle input does."""
+
+    algorithm = [rng.choice(".#") for _ in range(512)]
+    if rng.random() < 0.5:
+        algorithm[0], algorithm[511] = "#", "."
+    else:
+        algorithm[0] = "."
+
+    image = ["".join(rng.choice(".#") for _ in range(size)) for _ in range(size)]
+
+    return "\n".join(["".join(algorithm), ""] + image)
@@ -0,0 +1,11 @@
+import random
+
+
+def generate(size: int, *, rng: random.Random) -> str:
+    """Return the starting positions of both players.  The board has a fixed
+    size, so 'size' is ignored."""
+
+    return "".join(
+        f"Player {player} starting position: {rng.randint(1, 10)}\n"
+        for player in (1, 2)
+    )
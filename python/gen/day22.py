@@ -0,0 +1,25 @@
+import random
+
+
+def generate(size: int, *, rng: random.Random) -> str:
+    """Return 'size' reboot steps.  The first 20 steps lie in the
+    initialization region, and the rest are cuboids spread over the full
+    region, as in the puzzle input."""
+
+    steps = []
+    for step_idx in range(size):
+        if step_idx < 20:
+            extent, max_length = 50, 50
+        else:
+            extent, max_length = 100000, 40000
+
+        ranges = []
+        for axis in "xyz":
+            lower = rng.randint(-extent, extent - 1)
+            upper = min(extent, lower + rng.randint(0, max_length))
+            ranges.append(f"{axis}={lower}..{upper}")
+
+        state = "on" if step_idx == 0 or rng.random() < 0.7 else "off"
+        steps.append(f"{state} " + ",".join(ranges))
+
+    return "\n".join(steps)
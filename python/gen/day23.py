@@ -0,0 +1,18 @@
+import random
+
+
+def generate(size: int, *, rng: random.Random) -> str:
+    """Return a burrow with the amphipods shuffled between the siderooms.  The
+    burrow has a fixed shape, so 'size' is ignored."""
+
+    amphipods = rng.sample("AABBCCDD", 8)
+
+    return "\n".join(
+        [
+            "#############",
+            "#...........#",
+            "###" + "#".join(amphipods[:4]) + "###",
+            "  #" + "#".join(amphipods[4:]) + "#",
+            "  #########",
+        ]
+    )
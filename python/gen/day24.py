@@ -0,0 +1,55 @@
+import random
+from typing import List
+
+
+INSTRUCTION_GROUP = """inp w
+mul x 0
+add x z
+mod x 26
+div z {divisor}
+add x {check}
+eql x w
+eql x 0
+mul y 0
+add y 25
+mul y x
+add y 1
+mul z y
+mul y 0
+add y w
+add y {offset}
+mul y x
+add z y"""
+
+
+def generate(size: int, *, rng: random.Random) -> str:
+    """Return a MONAD program reading a model number of '2 * size' digits (the
+    puzzle input has 14).  Each digit either pushes onto, or is checked
+    against and pops from, a base-26 stack held in 'z', and every push is
+    matched by a pop so that some model number is valid."""
+
+    groups: List[str] = []
+    pending_offsets: List[int] = []
+    num_pushes = 0
+
+    while num_pushes < size or pending_offsets:
+        if num_pushes < size and (not pending_offsets or rng.random() < 0.5):
+            offset = rng.randint(1, 16)
+            pending_offsets.append(offset)
+            num_pushes += 1
+            groups.append(
+                INSTRUCTION_GROUP.format(
+                    divisor=1, check=rng.randint(10, 16), offset=offset
+                )
+            )
+        else:
+            # The popped digit must equal the pushed digit plus 'difference'.
+            difference = rng.randint(-8, 8)
+            check = difference - pending_offsets.pop()
+            groups.append(
+                INSTRUCTION_GROUP.format(
+                    divisor=26, check=check, offset=rng.randint(1, 16)
+                )
+            )
+
+    return "\n".join(groups)
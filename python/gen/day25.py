@@ -0,0 +1,10 @@
+import random
+
+
+def generate(size: int, *, rng: random.Random) -> str:
+    """Return a 'size' x 'size' seafloor, where a quarter of the cells hold
+    east-facing sea cucumbers and another quarter south-facing ones."""
+
+    return "\n".join(
+        "".join(rng.choice(">v..") for _ in range(size)) for _ in range(size)
+    )
@@ -0,0 +1,54 @@
+import random
+from typing import List, Optional
+
+
+def split_prefixes(
+    num_numbers: int, *, prefix: str, width: int, rng: random.Random
+) -> List[str]:
+    """Return the distinct prefixes of 'num_numbers' binary numbers of the
+    specified 'width', that start with the specified 'prefix'.  Whenever more
+    than one number shares a prefix, both bits follow that prefix in some
+    number, so that the ratings of part 2 always narrow down to one number."""
+
+    if num_numbers == 1:
+        return [prefix]
+
+    capacity = 2 ** (width - len(prefix) - 1)
+    num_zeroes = rng.randint(
+        max(1, num_numbers - capacity), min(capacity, num_numbers - 1)
+    )
+
+    return split_prefixes(
+        num_zeroes, prefix=prefix + "0", width=width, rng=rng
+    ) + split_prefixes(
+        num_numbers - num_zeroes, prefix=prefix + "1", width=width, rng=rng
+    )
+
+
+def generate(size: int, *, rng: random.Random, width: Optional[int] = None) -> str:
+    """Return 'size' binary numbers of the specified 'width', which defaults to
+    at least 12 bits and is raised to fit 'size' distinct numbers."""
+
+    width = max(width or 12, size.bit_length() + 1)
+
+    prefixes = split_prefixes(size, prefix="", width=width, rng=rng)
+    numbers = [
+        list(prefix) + [rng.choice("01") for _ in range(width - len(prefix))]
+        for prefix in prefixes
+    ]
+
+    # Part 1 needs both bits in every column.  A column that is constant
+    # across all numbers lies past the prefix of some number, whose bit is
+    # then free to flip.
+    if size > 1:
+        for bit_idx in range(width):
+            column = {number[bit_idx] for number in numbers}
+            if len(column) == 1:
+                number_idx = next(
+                    idx for idx, prefix in enumerate(prefixes) if len(prefix) <= bit_idx
+                )
+                numbers[number_idx][bit_idx] = "1" if column == {"0"} else "0"
+
+    rng.shuffle(numbers)
+
+    return "\n".join("".join(number) for number in numbers)
@@ -0,0 +1,19 @@
+import random
+
+
+def generate(size: int, *, rng: random.Random) -> str:
+    """Return a draw order followed by 'size' 5x5 bingo boards.  Every number
+    on every board is eventually drawn, so every board eventually wins."""
+
+    num_numbers = max(100, size)
+    draws = rng.sample(range(num_numbers), num_numbers)
+
+    boards = []
+    for _ in range(size):
+        numbers = rng.sample(range(num_numbers), 25)
+        rows = [numbers[row * 5 : (row + 1) * 5] for row in range(5)]
+        boards.append(
+            "\n".join(" ".join(f"{number:2d}" for number in row) for row in rows)
+        )
+
+    return "\n\n".join([",".join(map(str, draws))] + boards)
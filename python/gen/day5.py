@@ -0,0 +1,32 @@
+import random
+
+
+EXTENT = 1000
+
+
+def generate(size: int, *, rng: random.Random) -> str:
+    """Return 'size' horizontal, vertical or diagonal vents in a 1000x1000
+    area."""
+
+    vents = []
+    for _ in range(size):
+        x1 = rng.randrange(EXTENT)
+        y1 = rng.randrange(EXTENT)
+        dx, dy = rng.choice([(1, 0), (0, 1), (1, 1), (1, -1)])
+
+        limits = [EXTENT - 1 - x1 if dx else EXTENT]
+        if dy == 1:
+            limits.append(EXTENT - 1 - y1)
+        elif dy == -1:
+            limits.append(y1)
+
+        length = rng.randint(0, min(limits))
+        x2 = x1 + dx * length
+        y2 = y1 + dy * length
+
+        if rng.random() < 0.5:
+            x1, y1, x2, y2 = x2, y2, x1, y1
+
+        vents.append(f"{x1},{y1} -> {x2},{y2}")
+
+    return "\n".join(vents)
@@ -0,0 +1,7 @@
+import random
+
+
+def generate(size: int, *, rng: random.Random) -> str:
+    """Return 'size' lanternfish timers."""
+
+    return ",".join(str(rng.randint(1, 5)) for _ in range(size))
@@ -0,0 +1,9 @@
+import random
+
+
+def generate(size: int, *, rng: random.Random) -> str:
+    """Return 'size' crab positions, spread over a range of about 'size'
+    positions, so that both dimensions of the search scale together."""
+
+    extent = max(10, size)
+    return ",".join(str(rng.randrange(extent)) for _ in range(size))
@@ -0,0 +1,37 @@
+import random
+
+
+SEGMENTS = "abcdefg"
+
+DIGITS = [
+    "abcefg",
+    "cf",
+    "acdeg",
+    "acdfg",
+    "bcdf",
+    "abdfg",
+    "abdefg",
+    "acf",
+    "abcdefg",
+    "abcdfg",
+]
+
+
+def generate(size: int, *, rng: random.Random) -> str:
+    """Return 'size' displays, each with its own wiring of segments."""
+
+    def scramble(digit: str, wiring: dict) -> str:
+        wires = [wiring[segment] for segment in digit]
+        rng.shuffle(wires)
+        return "".join(wires)
+
+    displays = []
+    for _ in range(size):
+        wiring = dict(zip(SEGMENTS, rng.sample(SEGMENTS, len(SEGMENTS))))
+
+        patterns = [scramble(digit, wiring) for digit in rng.sample(DIGITS, 10)]
+        outputs = [scramble(rng.choice(DIGITS), wiring) for _ in range(4)]
+
+        displays.append(" ".join(patterns) + " | " + " ".join(outputs))
+
+    return "\n".join(displays)
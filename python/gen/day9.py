@@ -0,0 +1,17 @@
+import random
+
+
+def generate(size: int, *, rng: random.Random) -> str:
+    """Return a 'size' x 'size' heightmap, where roughly one in four heights
+    is a 9 that bounds the basins."""
+
+    rows = []
+    for _ in range(size):
+        rows.append(
+            "".join(
+                "9" if rng.random() < 0.25 else str(rng.randint(0, 8))
+                for _ in range(size)
+            )
+        )
+
+    return "\n".join(rows)
@@ -0,0 +1,235 @@
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+
+Offset = Tuple[int, int]
+
+NEIGHBOURS_4: Tuple[Offset, ...] = ((-1, 0), (1, 0), (0, -1), (0, 1))
+NEIGHBOURS_8: Tuple[Offset, ...] = (
+    (-1, -1),
+    (-1, 0),
+    (-1, 1),
+    (0, -1),
+    (0, 1),
+    (1, -1),
+    (1, 0),
+    (1, 1),
+)
+
+CONNECTIVITIES: Dict[int, Tuple[Offset, ...]] = {4: NEIGHBOURS_4, 8: NEIGHBOURS_8}
+
+# Map the bytes '0' to '9' to the values 0 to 9, and back.
+DIGITS_TO_VALUES = bytes.maketrans(b"0123456789", bytes(range(10)))
+VALUES_TO_DIGITS = bytes.maketrans(bytes(range(10)), b"0123456789")
+
+
+class Grid:
+    """A rectangular grid of byte-sized cells, stored row-major in a single
+    flat 'bytearray', so that each cell takes one byte rather than a boxed
+    'int' or 'str' in a list of lists.  The cell at row 'x' and column 'y'
+    lives at index 'x * stride + y'.  'grid[x][y]' reads and writes cells
+    through a 'memoryview' of row 'x', so code written against 'List[List[int]]'
+    (e.g. 'len(grid)', 'len(grid[0])') works unchanged.  A grid with
+    'wraparound' set is a torus, whose neighbours wrap across its edges."""
+
+    def __init__(
+        self,
+        cells: bytearray,
+        *,
+        num_rows: int,
+        num_cols: int,
+        wraparound: bool = False,
+    ) -> None:
+        """..."""
+
+        assert (
+            len(cells) == num_rows * num_cols
+        ), f"Expected {num_rows}x{num_cols} cells, got {len(cells)}"
+
+        self.cells = cells
+        self.num_rows = num_rows
+        self.num_cols = num_cols
+        self.stride = num_cols
+        self.wraparound = wraparound
+
+        view = memoryview(cells)
+        self._rows = [
+            view[row_start : row_start + num_cols]
+            for row_start in range(0, len(cells), num_cols)
+        ]
+
+        # Bounds masks and flat neighbour offsets, keyed by connectivity, are
+        # built on first use.
+        self._masks: Dict[int, bytearray] = {}
+        self._offsets_by_mask: Dict[int, List[Tuple[int, ...]]] = {}
+
+    @classmethod
+    def from_text(
+        cls, input: Union[str, bytes], *, digits: bool, wraparound: bool = False
+    ) -> "Grid":
+        """Return the grid of the specified 'input', with one row per line.  If
+        'digits' is set, each cell holds the value of a digit, and otherwise
+        it holds the byte of a character."""
+
+        data = input.encode() if isinstance(input, str) else input
+        lines = data.splitlines()
+
+        num_rows = len(lines)
+        num_cols = len(lines[0]) if lines else 0
+        assert all(
+            len(line) == num_cols for line in lines
+        ), f"Expected every row to have {num_cols} columns"
+
+        cells = bytearray(b"".join(lines))
+        if digits:
+            cells = cells.translate(DIGITS_TO_VALUES)
+            assert not cells or max(cells) <= 9, "Expected every cell to be a digit"
+
+        return cls(cells, num_rows=num_rows, num_cols=num_cols, wraparound=wraparound)
+
+    @classmethod
+    def from_digits(cls, input: Union[str, bytes], **kwargs) -> "Grid":
+        """..."""
+
+        return cls.from_text(input, digits=True, **kwargs)
+
+    @classmethod
+    def from_chars(cls, input: Union[str, bytes], **kwargs) -> "Grid":
+        """..."""
+
+        return cls.from_text(input, digits=False, **kwargs)
+
+    def copy(self) -> "Grid":
+        """..."""
+
+        return Grid(
+            bytearray(self.cells),
+            num_rows=self.num_rows,
+            num_cols=self.num_cols,
+            wraparound=self.wraparound,
+        )
+
+    def __len__(self) -> int:
+        """Return the number of rows, as for a list of rows."""
+
+        return self.num_rows
+
+    def __getitem__(self, x: int) -> memoryview:
+        """..."""
+
+        return self._rows[x]
+
+    def __iter__(self) -> Iterator[memoryview]:
+        """..."""
+
+        return iter(self._rows)
+
+    def __eq__(self, other: object) -> bool:
+        """..."""
+
+        return (
+            isinstance(other, Grid)
+            and self.num_cols == other.num_cols
+            and self.cells == other.cells
+        )
+
+    def dimensions(self) -> Tuple[int, int]:
+        """..."""
+
+        return self.num_rows, self.num_cols
+
+    def index(self, x: int, y: int) -> int:
+        """..."""
+
+        return x * self.stride + y
+
+    def position(self, index: int) -> Tuple[int, int]:
+        """..."""
+
+        return divmod(index, self.stride)
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        """..."""
+
+        return 0 <= x < self.num_rows and 0 <= y < self.num_cols
+
+    def step(self, index: int, offset: Offset) -> Optional[int]:
+        """Return the index of the cell at the specified 'offset' from the cell
+        at the specified 'index', or 'None' if it is off a grid that does not
+        wrap around."""
+
+        x, y = divmod(index, self.stride)
+        delta_x, delta_y = offset
+        x += delta_x
+        y += delta_y
+
+        if self.wraparound:
+            return (x % self.num_rows) * self.stride + y % self.num_cols
+
+        if 0 <= x < self.num_rows and 0 <= y < self.num_cols:
+            return x * self.stride + y
+
+        return None
+
+    def neighbours(self, index: int, *, connectivity: int = 4) -> List[int]:
+        """Return the indices of the neighbours of the cell at the specified
+        'index', with the specified 'connectivity' of either 4 or 8."""
+
+        if self.wraparound:
+            return [
+                self.step(index, offset) for offset in CONNECTIVITIES[connectivity]
+            ]
+
+        if connectivity not in self._masks:
+            self._build_masks(connectivity)
+
+        offsets = self._offsets_by_mask[connectivity][
+            self._masks[connectivity][index]
+        ]
+        return [index + offset for offset in offsets]
+
+    def _build_masks(self, connectivity: int) -> None:
+        """Compute, for every cell, the bitmask of which neighbour offsets stay
+        on the grid, and, for every bitmask, the flat offsets it selects."""
+
+        offsets = CONNECTIVITIES[connectivity]
+
+        # Cells only differ in their mask by whether they are on the first or
+        # last row or column, so each row is built from at most three masks.
+        def mask_of(x: int, y: int) -> int:
+            return sum(
+                1 << bit
+                for bit, (delta_x, delta_y) in enumerate(offsets)
+                if self.in_bounds(x + delta_x, y + delta_y)
+            )
+
+        masks = bytearray()
+        for x in range(self.num_rows):
+            if self.num_cols == 1:
+                masks.append(mask_of(x, 0))
+                continue
+
+            masks.append(mask_of(x, 0))
+            masks.extend(bytes([mask_of(x, 1)]) * (self.num_cols - 2))
+            masks.append(mask_of(x, self.num_cols - 1))
+
+        flat_offsets = [delta_x * self.stride + delta_y for delta_x, delta_y in offsets]
+
+        self._masks[connectivity] = masks
+        self._offsets_by_mask[connectivity] = [
+            tuple(
+                flat_offset
+                for bit, flat_offset in enumerate(flat_offsets)
+                if mask & (1 << bit)
+            )
+            for mask in range(1 << len(offsets))
+        ]
+
+    def to_text(self, *, digits: bool) -> str:
+        """Return the inverse of 'from_text'."""
+
+        cells = self.cells.translate(VALUES_TO_DIGITS) if digits else self.cells
+
+        return "\n".join(
+            cells[row_start : row_start + self.stride].decode()
+            for row_start in range(0, len(cells), self.stride)
+        )
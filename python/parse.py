@@ -0,0 +1,128 @@
+from array import array
+from typing import Iterator, List, Optional, Tuple, Union
+
+from python.grid import DIGITS_TO_VALUES, Grid
+
+
+Text = Union[str, bytes]
+
+# Every value is parsed into a signed 64-bit 'array', so that a list of
+# integers costs 8 bytes each rather than a boxed 'int' and a list slot.
+DEFAULT_TYPECODE = "q"
+
+# Map every byte that cannot be part of an integer to a space, so that a single
+# 'split' tokenises integers between any separators: commas, newlines, 'x=' or
+# '..' alike.
+INTEGER_BYTES = b"-0123456789"
+SEPARATORS_TO_SPACES = bytes(
+    byte if byte in INTEGER_BYTES else ord(" ") for byte in range(256)
+)
+
+# The bytes that may always separate integers, when the separators are given.
+WHITESPACE = b" \t\r\n"
+
+
+def as_bytes(input: Text) -> bytes:
+    """..."""
+
+    return input.encode() if isinstance(input, str) else input
+
+
+def parse_ints(
+    input: Text, *, separators: Optional[bytes] = None, typecode: str = DEFAULT_TYPECODE
+) -> array:
+    """Return every integer of the specified 'input', in order, as a contiguous
+    'array' of the specified 'typecode'.  If the specified 'separators' are
+    given, only those bytes and whitespace may separate integers, and any
+    other byte is an error.  Otherwise, any byte other than a digit or a '-'
+    separates integers, so a '-' in 'input' must be the sign of an integer."""
+
+    data = as_bytes(input)
+
+    if separators is None:
+        table = SEPARATORS_TO_SPACES
+    else:
+        unexpected = data.translate(None, INTEGER_BYTES + WHITESPACE + separators)
+        assert not unexpected, f"Unexpected {unexpected[:1]!r} between integers"
+        table = bytes.maketrans(separators, b" " * len(separators))
+
+    tokens = data.translate(table).split()
+    return array(typecode, map(int, tokens))
+
+
+def parse_int_lines(input: Text) -> List[int]:
+    """Return the integers of the specified 'input', which has exactly one
+    integer on each line, in a single pass of 'int' over the lines.  The
+    result is a list rather than an 'array', as hot loops over it would
+    otherwise box every element again on every read."""
+
+    return list(map(int, input.splitlines()))
+
+
+def parse_int_list(input: Text) -> List[int]:
+    """Return the integers of the specified 'input', a single comma-separated
+    list such as '3,4,3,1,2', as for 'parse_int_lines'."""
+
+    return list(map(int, input.split(b"," if isinstance(input, bytes) else ",")))
+
+
+def parse_records(
+    input: Text, *, num_fields: int, typecode: str = DEFAULT_TYPECODE
+) -> array:
+    """Return the integers of the specified 'input', which has one record of
+    the specified 'num_fields' integers per line, flattened into one 'array'
+    with the fields of record 'i' at '[i * num_fields, (i + 1) * num_fields)'."""
+
+    data = as_bytes(input)
+    values = parse_ints(data, typecode=typecode)
+
+    num_records = len(data.splitlines())
+    assert len(values) == num_records * num_fields, (
+        f"Expected {num_fields} integers on each of {num_records} lines, "
+        f"got {len(values)} in total"
+    )
+
+    return values
+
+
+def parse_segments(input: Text, *, typecode: str = DEFAULT_TYPECODE) -> array:
+    """Return the records of the specified 'input', with one 'x1,y1 -> x2,y2'
+    segment per line, as for 'parse_records'."""
+
+    # The '-' of each arrow would otherwise be read as a sign.
+    data = as_bytes(input).replace(b"->", b"  ")
+    return parse_records(data, num_fields=4, typecode=typecode)
+
+
+def parse_ranges(
+    input: Text, *, num_dimensions: int, typecode: str = DEFAULT_TYPECODE
+) -> array:
+    """Return the records of the specified 'input', with one range of the form
+    'x=MIN..MAX,y=MIN..MAX,...' over the specified 'num_dimensions' per line, as
+    for 'parse_records'.  Text before the first range (e.g. 'on ') is ignored."""
+
+    return parse_records(input, num_fields=2 * num_dimensions, typecode=typecode)
+
+
+def iter_records(values: array, *, num_fields: int) -> Iterator[Tuple[int, ...]]:
+    """Return an iterator over the records of the specified 'values', as
+    returned by 'parse_records', as tuples of the specified 'num_fields'."""
+
+    fields = iter(values)
+    return zip(*[fields] * num_fields)
+
+
+def parse_digit_grid(input: Text, **kwargs) -> Grid:
+    """..."""
+
+    return Grid.from_digits(input, **kwargs)
+
+
+def parse_digit_rows(input: Text) -> List[List[int]]:
+    """Return the grid of digits of the specified 'input' as a list of rows,
+    each decoded with one 'translate' rather than one 'int' call per digit."""
+
+    rows = [line.translate(DIGITS_TO_VALUES) for line in as_bytes(input).splitlines()]
+    assert all(not row or max(row) <= 9 for row in rows), "Expected only digits"
+
+    return [list(row) for row in rows]
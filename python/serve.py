@@ -0,0 +1,149 @@
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import os
+import signal
+import socketserver
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List
+
+from python.util import (
+    InputStream,
+    Solution,
+    format_answer,
+    load_input,
+    takes_input_stream,
+    timed_solution,
+)
+
+
+DAYS = list(range(1, 26))
+
+DEFAULT_SOCKET = Path(
+    os.environ.get(
+        "AOC_SOLVER_SOCKET",
+        Path(tempfile.gettempdir()) / "advent-of-code-2021.sock",
+    )
+)
+
+
+def load_solutions() -> Dict[int, Dict[int, Solution]]:
+    """Import every 'python.dayN' module up front, and return the solutions
+    of each day keyed by day, then by part."""
+
+    solutions = {}
+    for day in DAYS:
+        module = importlib.import_module(f"python.day{day}")
+        solutions[day] = {1: module.part1, 2: module.part2}
+
+    return solutions
+
+
+def handle_request(
+    request: Dict[str, Any], *, solutions: Dict[int, Dict[int, Solution]]
+) -> Dict[str, Any]:
+    """Return the response to the specified 'request', which holds the 'day'
+    and 'part' to solve, and exactly one of 'input_path' or 'input_text'."""
+
+    day = int(request["day"])
+    part = int(request["part"])
+    assert day in solutions, f"Day ({day}) must be one of {DAYS}"
+    assert part in (1, 2), f"Part ({part}) must be either 1 or 2"
+
+    assert ("input_path" in request) != (
+        "input_text" in request
+    ), "Expected exactly one of 'input_path' or 'input_text'"
+
+    solution = solutions[day][part]
+
+    if "input_path" in request:
+        input = load_input(solution, Path(request["input_path"]))
+    elif takes_input_stream(solution):
+        input = InputStream.from_text(request["input_text"])
+    else:
+        input = request["input_text"]
+
+    # Some solutions (e.g. day 13) render their answer to stdout, which is
+    # captured and forwarded to the client.
+
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        answer, elapsed_time = timed_solution(solution, input)
+
+    return {
+        "answer": answer if answer is None or type(answer) is int else str(answer),
+        "elapsed_time": elapsed_time,
+        "output": output.getvalue(),
+        "line": format_answer(part, answer, elapsed_time),
+    }
+
+
+class SolverRequestHandler(socketserver.StreamRequestHandler):
+    """Serve newline-delimited JSON requests on a single connection, writing
+    one newline-delimited JSON response per request."""
+
+    def handle(self) -> None:
+        """..."""
+
+        for line in self.rfile:
+            try:
+                response = handle_request(
+                    json.loads(line), solutions=self.server.solutions
+                )
+            except Exception as error:
+                response = {"error": f"{type(error).__name__}: {error}"}
+
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+
+
+class SolverServer(socketserver.UnixStreamServer):
+    """Requests are served one at a time, because some solutions (e.g. day 23)
+    keep module-level state that is not safe to share across threads."""
+
+    def __init__(self, socket_path: Path) -> None:
+        """..."""
+
+        self.solutions = load_solutions()
+        super().__init__(str(socket_path), SolverRequestHandler)
+
+
+def parse_args(args: List[str]) -> argparse.Namespace:
+    """..."""
+
+    parser = argparse.ArgumentParser(prog="python -m python.serve")
+    parser.add_argument("--socket", type=Path, default=DEFAULT_SOCKET)
+
+    return parser.parse_args(args)
+
+
+def main(args: List[str]) -> int:
+    """..."""
+
+    parsed_args = parse_args(args)
+
+    with contextlib.suppress(FileNotFoundError):
+        parsed_args.socket.unlink()
+
+    # Exit cleanly on SIGTERM, so that the socket file is removed.
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+    with SolverServer(parsed_args.socket) as server:
+        print(f"Serving solutions on {parsed_args.socket}", flush=True)
+
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            parsed_args.socket.unlink()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,21 @@
+from pathlib import Path
+
+import pytest
+
+from python import day3
+
+
+SAMPLE = (Path(__file__).resolve().parents[2] / "data/sample/day3.txt").read_text()
+
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n"])
+def test_parts_accept_either_line_ending(newline: str) -> None:
+    input = newline.join(SAMPLE.splitlines()) + newline
+
+    assert day3.part1(input) == 198
+    assert day3.part2(input) == 230
+
+
+def test_parse_packed_report_rejects_other_than_bits() -> None:
+    with pytest.raises(AssertionError):
+        day3.parse_packed_report("0101\n01x1\n")
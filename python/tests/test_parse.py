@@ -0,0 +1,27 @@
+import pytest
+
+from python import day1
+from python.parse import parse_int_lines, parse_int_list
+
+
+def test_parse_int_lines() -> None:
+    assert parse_int_lines("199\n200\n-3\n") == [199, 200, -3]
+    assert parse_int_lines(b"199\n200\n") == [199, 200]
+
+
+@pytest.mark.parametrize("input", ["1 2\n\n3\n4", "1\n\n2\n", "1,2\n3\n"])
+def test_parse_int_lines_rejects_other_than_one_integer_per_line(input: str) -> None:
+    with pytest.raises(ValueError):
+        parse_int_lines(input)
+
+
+def test_day1_rejects_other_than_one_reading_per_line() -> None:
+    with pytest.raises(ValueError):
+        day1.part1("1 2\n\n3\n4")
+
+
+def test_parse_int_list() -> None:
+    assert parse_int_list("3,4,3,1,2\n") == [3, 4, 3, 1, 2]
+
+    with pytest.raises(ValueError):
+        parse_int_list("3,,4")
@@ -1,13 +1,173 @@
 import argparse
+import atexit
+import collections
+import concurrent.futures
+import contextlib
+import cProfile
+import functools
+import hashlib
+import inspect
+import io
+import json
+import mmap
+import multiprocessing
+import multiprocessing.pool
+import os
+import pickle
+import pstats
+import sqlite3
+import statistics
 import sys
+import threading
 import time
+import tracemalloc
+import types
 from pathlib import Path
-from typing import Callable, List, Literal, Protocol, Union
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Counter,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Protocol,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+INPUT_TYPES = ("sample", "test")
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# The name of the package holding the solutions, e.g. 'python'.
+PACKAGE_NAME = __name__.partition(".")[0]
+
+CACHE_DIR = Path(
+    os.environ.get("AOC_CACHE_DIR", Path.home() / ".cache" / "advent-of-code-2021")
+)
+
+
+class InputStream:
+    """A bytes-level view over an input, which is memory-mapped when read from
+    a file, so that the input can be scanned line by line, or chunk by chunk,
+    in bounded memory and without decoding it as a whole.  'path' is the
+    file that the input was read from, if any, so that other processes can
+    read ranges of it themselves rather than receive them pickled."""
+
+    def __init__(
+        self, buffer: Union[bytes, mmap.mmap], *, path: Optional[Path] = None
+    ) -> None:
+        """..."""
+
+        self._buffer = buffer
+        self.path = path
+
+    @classmethod
+    def from_path(cls, path: Path) -> "InputStream":
+        """..."""
+
+        with open(path, "rb") as file:
+            # Empty files cannot be memory-mapped.
+            if not file.seek(0, 2):
+                return cls(b"", path=path)
+
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            return cls(buffer, path=path)
+
+    @classmethod
+    def from_text(cls, text: str) -> "InputStream":
+        """..."""
+
+        return cls(text.encode())
+
+    def __len__(self) -> int:
+        """..."""
+
+        return len(self._buffer)
+
+    def chunk_ranges(
+        self, size: int = DEFAULT_CHUNK_SIZE
+    ) -> Generator[Tuple[int, int], None, None]:
+        """Yield the '[start, stop)' byte offsets of consecutive chunks of about
+        the specified 'size' bytes, each ending on a line boundary.  A line
+        longer than 'size' is never split across chunks."""
+
+        assert size > 0, f"Chunk size ({size}) must be positive"
+
+        buffer = self._buffer
+        start, end = 0, len(buffer)
+
+        while start < end:
+            stop = min(start + size, end)
+
+            if stop < end:
+                newline = buffer.rfind(b"\n", start, stop)
+                if newline == -1:
+                    newline = buffer.find(b"\n", stop)
+
+                stop = end if newline == -1 else newline + 1
+
+            yield start, stop
+            start = stop
+
+    def chunks(self, size: int = DEFAULT_CHUNK_SIZE) -> Generator[bytes, None, None]:
+        """..."""
+
+        for start, stop in self.chunk_ranges(size):
+            yield self._buffer[start:stop]
+
+    def chunk_sources(
+        self, size: int = DEFAULT_CHUNK_SIZE
+    ) -> Generator[Tuple[Union[Path, bytes], int, int], None, None]:
+        """Yield a picklable '(source, start, stop)' for each chunk of
+        'chunk_ranges', which 'read_chunk' turns back into the bytes of the
+        chunk.  'source' is the path of the input, if it was read from a file,
+        and the bytes of the chunk otherwise."""
+
+        for start, stop in self.chunk_ranges(size):
+            if self.path is None:
+                yield self._buffer[start:stop], 0, stop - start
+            else:
+                yield self.path, start, stop
+
+    def lines(self) -> Generator[bytes, None, None]:
+        """Yield each line of the input, without its line terminator."""
+
+        for chunk in self.chunks():
+            yield from chunk.splitlines()
+
+
+Input = Union[str, InputStream]
+Solution = Callable[[Input], int]
 
 
 class CommandLineArgs(Protocol):
     part: Union[Literal[1], Literal[2]]
-    input: Path
+    input: Optional[Path]
+    input_dir: Optional[Path]
+    input_glob: str
+    max_in_flight: Optional[int]
+    repeat: int
+    profile: bool
+    profile_out: Optional[Path]
+    flamegraph_out: Optional[Path]
+    trace_memory: bool
+    parse_cache: bool
+    no_cache: bool
+    cache_stats: bool
+    executor: Optional[str]
+    workers: Optional[int]
+    executor_stats: bool
+    instrument: bool
+    instrument_out: Optional[Path]
 
 
 def parse_args(args: List[str]) -> CommandLineArgs:
@@ -15,28 +175,1373 @@ def parse_args(args: List[str]) -> CommandLineArgs:
 
     parser = argparse.ArgumentParser()
     parser.add_argument("--part", type=int, choices=[1,2], required=True)
-    parser.add_argument("--input", type=Path, required=True)
+    parser.add_argument("--input", type=Path)
+    parser.add_argument("--input-dir", type=Path)
+    parser.add_argument("--input-glob", type=str, default="*")
+    parser.add_argument("--max-in-flight", type=int)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--profile", action="store_true")
+    parser.add_argument("--profile-out", type=Path)
+    parser.add_argument("--flamegraph-out", type=Path)
+    parser.add_argument("--trace-memory", action="store_true")
+    parser.add_argument("--parse-cache", action="store_true")
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("--cache-stats", action="store_true")
+    parser.add_argument("--executor", type=str, choices=EXECUTOR_BACKENDS)
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--executor-stats", action="store_true")
+    parser.add_argument("--instrument", action="store_true")
+    parser.add_argument("--instrument-out", type=Path)
 
-    return parser.parse_args(args)
+    parsed_args = parser.parse_args(args)
+    if (parsed_args.input is None) == (parsed_args.input_dir is None):
+        parser.error("exactly one of --input or --input-dir is required")
+    if parsed_args.max_in_flight is not None and parsed_args.max_in_flight < 1:
+        parser.error(
+            "argument --max-in-flight: must be positive, "
+            f"got {parsed_args.max_in_flight}"
+        )
+    if parsed_args.repeat < 1:
+        parser.error(f"argument --repeat: must be positive, got {parsed_args.repeat}")
+    if parsed_args.workers is not None and parsed_args.workers < 1:
+        parser.error(f"argument --workers: must be positive, got {parsed_args.workers}")
+
+    return parsed_args
+
+
+def input_digest(input: Input) -> str:
+    """Return the SHA-256 digest of the bytes of the specified 'input'."""
+
+    digest = hashlib.sha256()
+
+    if isinstance(input, InputStream):
+        for chunk in input.chunks():
+            digest.update(chunk)
+    else:
+        digest.update(input.encode())
+
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def module_digest(module_name: str) -> str:
+    """Return the SHA-256 digest of the source of the module with the specified
+    'module_name'."""
+
+    source_file = inspect.getsourcefile(sys.modules[module_name])
+    return hashlib.sha256(Path(source_file).read_bytes()).hexdigest()
+
+
+def module_stem(module_name: str) -> str:
+    """Return the stem of the source file of the module with the specified
+    'module_name' (e.g. 'day23'), whether or not it is running as '__main__'."""
+
+    return Path(inspect.getsourcefile(sys.modules[module_name])).stem
+
+
+def module_dependencies(module_name: str) -> List[str]:
+    """Return the names of the loaded modules of this package that the module
+    with the specified 'module_name' depends on, directly or through other
+    modules of this package, including that module itself."""
+
+    dependencies = set()
+    pending = [module_name]
+
+    while pending:
+        name = pending.pop()
+        if name in dependencies:
+            continue
+        dependencies.add(name)
+
+        # Both 'from python import parse' and 'from python.parse import
+        # parse_ints' leave a global that names 'python.parse'.
+        for value in vars(sys.modules[name]).values():
+            if isinstance(value, types.ModuleType):
+                dependency = value.__name__
+            else:
+                dependency = getattr(value, "__module__", None)
+
+            if (
+                isinstance(dependency, str)
+                and dependency.startswith(f"{PACKAGE_NAME}.")
+                and dependency in sys.modules
+            ):
+                pending.append(dependency)
+
+    return sorted(dependencies, key=module_stem)
+
+
+@functools.lru_cache(maxsize=None)
+def code_digest(module_name: str) -> str:
+    """Return the SHA-256 digest of the sources of the module with the specified
+    'module_name' and of every module of this package it depends on, so that
+    editing a shared module such as 'python/parse.py' changes the digest of
+    every module that uses it."""
+
+    digest = hashlib.sha256()
+    for dependency in module_dependencies(module_name):
+        digest.update(f"{module_stem(dependency)}\0".encode())
+        digest.update(module_digest(dependency).encode())
+
+    return digest.hexdigest()
+
+
+class ParseCache:
+    """A content-addressed, on-disk cache of parsed inputs, stored as pickles
+    under 'directory'.  Entries are keyed by the digest of the input and by
+    the identity of the parser, which includes the digest of the sources of
+    the parser's module and of the modules it uses, so that editing a parser
+    or a shared module such as 'python/parse.py' invalidates its entries.
+    The least recently used entries are evicted once the cache grows beyond
+    'max_bytes'."""
+
+    def __init__(self, directory: Path, *, max_bytes: int, enabled: bool) -> None:
+        """..."""
+
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+
+    def path_for(self, parser: Callable, input: Input) -> Path:
+        """..."""
+
+        # Key on the source file rather than '__module__', which is '__main__'
+        # under 'python -m python.dayN', so that every runner shares entries.
+        parser_identity = "\0".join(
+            [
+                module_stem(parser.__module__),
+                parser.__qualname__,
+                code_digest(parser.__module__),
+            ]
+        )
+        key = hashlib.sha256(
+            f"{parser_identity}\0{input_digest(input)}".encode()
+        ).hexdigest()
+
+        return self.directory / f"{key}.pickle"
+
+    def load(self, path: Path) -> Tuple[bool, Any]:
+        """Return whether the entry at the specified 'path' exists, and its
+        parsed value if so.  Unreadable entries are treated as missing."""
+
+        try:
+            with open(path, "rb") as file:
+                parsed = pickle.load(file)
+        except FileNotFoundError:
+            return False, None
+        except Exception:
+            path.unlink(missing_ok=True)
+            return False, None
+
+        # Refresh the modification time, which orders the LRU eviction.
+        os.utime(path)
+
+        return True, parsed
+
+    def store(self, path: Path, parsed: Any) -> None:
+        """..."""
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file first, so that concurrent readers never
+        # observe a partially written entry.
+        temporary_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(temporary_path, "wb") as file:
+            pickle.dump(parsed, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, path)
+
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until the cache holds at most
+        'max_bytes'."""
+
+        entries = []
+        for path in self.directory.glob("*.pickle"):
+            with contextlib.suppress(FileNotFoundError):
+                stat = path.stat()
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_bytes:
+                break
+
+            path.unlink(missing_ok=True)
+            total_size -= size
+
+    def clear(self) -> int:
+        """Remove every entry, and return the number of entries removed."""
+
+        num_removed = 0
+        for path in self.directory.glob("*.pickle"):
+            path.unlink(missing_ok=True)
+            num_removed += 1
+
+        return num_removed
+
+
+PARSE_CACHE = ParseCache(
+    CACHE_DIR / "parsed",
+    max_bytes=int(os.environ.get("AOC_PARSE_CACHE_MAX_BYTES", 256 << 20)),
+    enabled=os.environ.get("AOC_PARSE_CACHE", "0") == "1",
+)
+
+Parsed = TypeVar("Parsed")
+
+
+class AnswerKey(NamedTuple):
+    solution: str
+    part: int
+    input_digest: str
+    code_digest: str
+
+
+class AnswerStore:
+    """A local SQLite store of answers, keyed by 'AnswerKey', so that a
+    solution whose source and input are unchanged returns instantly.  Hits
+    and misses are counted in the store itself.  The least recently used
+    answers are evicted once the store holds more than 'max_entries' answers
+    or more than 'max_bytes' bytes of keys and answers."""
+
+    def __init__(self, path: Path, *, max_entries: int, max_bytes: int) -> None:
+        """..."""
+
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+    def _connect(self) -> sqlite3.Connection:
+        """..."""
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        connection = sqlite3.connect(self.path, timeout=30)
+        connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS answers (
+                solution TEXT NOT NULL,
+                part INTEGER NOT NULL,
+                input_digest TEXT NOT NULL,
+                code_digest TEXT NOT NULL,
+                answer TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                last_used REAL NOT NULL,
+                PRIMARY KEY (solution, part, input_digest, code_digest)
+            );
+            CREATE TABLE IF NOT EXISTS counters (
+                name TEXT PRIMARY KEY,
+                value INTEGER NOT NULL
+            );
+            """
+        )
+        return connection
+
+    def _increment(self, connection: sqlite3.Connection, name: str) -> None:
+        """..."""
+
+        connection.execute(
+            "INSERT INTO counters VALUES (?, 1) "
+            "ON CONFLICT (name) DO UPDATE SET value = value + 1",
+            (name,),
+        )
+
+    def lookup(self, key: AnswerKey) -> Optional[str]:
+        """Return the stored answer for the specified 'key', or 'None' if there
+        is no such answer."""
+
+        with contextlib.closing(self._connect()) as connection, connection:
+            row = connection.execute(
+                "SELECT answer FROM answers WHERE solution = ? AND part = ? "
+                "AND input_digest = ? AND code_digest = ?",
+                key,
+            ).fetchone()
+
+            if row is None:
+                self._increment(connection, "misses")
+                return None
+
+            self._increment(connection, "hits")
+            connection.execute(
+                "UPDATE answers SET last_used = ? WHERE solution = ? AND part = ? "
+                "AND input_digest = ? AND code_digest = ?",
+                (time.time(), *key),
+            )
+
+            return row[0]
+
+    def store(self, key: AnswerKey, answer: str) -> None:
+        """..."""
+
+        size = sum(len(str(field)) for field in key) + len(answer)
+
+        with contextlib.closing(self._connect()) as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (*key, answer, size, time.time()),
+            )
+            self._evict(connection)
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        """Remove the least recently used answers until the store holds at most
+        'max_entries' answers and at most 'max_bytes' bytes."""
+
+        num_entries, total_size = connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM answers"
+        ).fetchone()
+
+        rows = connection.execute(
+            "SELECT rowid, size FROM answers ORDER BY last_used"
+        ).fetchall()
+
+        for rowid, size in rows:
+            if num_entries <= self.max_entries and total_size <= self.max_bytes:
+                break
+
+            connection.execute("DELETE FROM answers WHERE rowid = ?", (rowid,))
+            num_entries -= 1
+            total_size -= size
+
+    def stats(self) -> Dict[str, int]:
+        """..."""
+
+        with contextlib.closing(self._connect()) as connection:
+            counters = dict(connection.execute("SELECT name, value FROM counters"))
+            num_entries, total_size = connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM answers"
+            ).fetchone()
+
+        return {
+            "hits": counters.get("hits", 0),
+            "misses": counters.get("misses", 0),
+            "entries": num_entries,
+            "bytes": total_size,
+        }
+
+    def clear(self) -> int:
+        """Remove every answer and reset the counters, and return the number of
+        answers removed."""
+
+        with contextlib.closing(self._connect()) as connection, connection:
+            num_removed = connection.execute("DELETE FROM answers").rowcount
+            connection.execute("DELETE FROM counters")
+
+        return num_removed
+
+
+ANSWER_STORE = AnswerStore(
+    CACHE_DIR / "answers.sqlite3",
+    max_entries=int(os.environ.get("AOC_ANSWER_CACHE_MAX_ENTRIES", 10_000)),
+    max_bytes=int(os.environ.get("AOC_ANSWER_CACHE_MAX_BYTES", 16 << 20)),
+)
+
+
+def answer_key(solution: Solution, part: int, input: Input) -> AnswerKey:
+    """Return the key of the answer of the specified 'solution' to the specified
+    'part' on the specified 'input'.  The key covers the source of the module
+    defining 'solution' (e.g. 'python/day23.py'), whether or not that module is
+    running as '__main__', and of every module of this package it uses."""
+
+    module_name = solution.__module__
+
+    return AnswerKey(
+        solution=module_stem(module_name),
+        part=part,
+        input_digest=input_digest(input),
+        code_digest=code_digest(module_name),
+    )
+
+
+class SpanStats(NamedTuple):
+    count: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+
+
+class Histogram:
+    """The count, total, minimum and maximum of the values observed under one
+    name, with the values bucketed by powers of two."""
+
+    def __init__(self) -> None:
+        """..."""
+
+        self.count = 0
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+        self.buckets: Counter[int] = collections.Counter()
+
+    def observe(self, value: int) -> None:
+        """..."""
+
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+        # Bucket 'b' holds the values below '2**b', and at least '2**(b-1)'.
+        self.buckets[int(value).bit_length()] += 1
+
+    def merge(self, other: "Histogram") -> None:
+        """..."""
+
+        if other.count == 0:
+            return
+
+        self.count += other.count
+        self.total += other.total
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        self.buckets.update(other.buckets)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """..."""
+
+        return {
+            "count": self.count,
+            "total": self.total,
+            "min": self.min,
+            "max": self.max,
+            "buckets": {
+                f"<{2 ** bucket}": count
+                for bucket, count in sorted(self.buckets.items())
+            },
+        }
+
+
+class Span:
+    """A context manager that records the time spent in its body under a
+    name."""
+
+    def __init__(self, instrumentation: "Instrumentation", name: str) -> None:
+        """..."""
+
+        self.instrumentation = instrumentation
+        self.name = name
+
+    def __enter__(self) -> None:
+        """..."""
+
+        self.start_time_in_seconds = time.perf_counter()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """..."""
+
+        elapsed_time = time.perf_counter() - self.start_time_in_seconds
+        self.instrumentation.record_span(self.name, elapsed_time)
+
+
+NULL_SPAN = contextlib.nullcontext()
+
+
+class Instrumentation:
+    """Named counters, histograms and timed spans for the hot paths of the
+    solutions, e.g. the nodes expanded by a search.  Every method returns
+    straight away when 'enabled' is unset, and 'span' then returns a shared,
+    empty context manager, so that instrumented code costs one attribute
+    check per call when disabled.  Loops that are hot enough for even that to
+    matter can check 'enabled' once, up front.  Records are guarded by a lock,
+    as the workers of the 'thread' executor backend record into the same
+    instrumentation."""
+
+    def __init__(self, *, enabled: bool) -> None:
+        """..."""
+
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self.reset()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the state to pickle, e.g. to send back from a worker process,
+        which leaves out the lock."""
+
+        return {name: value for name, value in vars(self).items() if name != "_lock"}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """..."""
+
+        vars(self).update(state)
+        self._lock = threading.Lock()
+
+    def reset(self) -> None:
+        """..."""
+
+        self.counters: Counter[str] = collections.Counter()
+        self.histograms: Dict[str, Histogram] = {}
+        self.spans: Dict[str, SpanStats] = {}
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """..."""
+
+        if self.enabled:
+            with self._lock:
+                self.counters[name] += amount
+
+    def observe(self, name: str, value: int) -> None:
+        """Record the specified 'value' in the histogram of the specified
+        'name'."""
+
+        if self.enabled:
+            with self._lock:
+                if name not in self.histograms:
+                    self.histograms[name] = Histogram()
+                self.histograms[name].observe(value)
+
+    def span(self, name: str) -> ContextManager[None]:
+        """Return a context manager that records the time spent in its body
+        under the specified 'name'."""
+
+        return Span(self, name) if self.enabled else NULL_SPAN
+
+    def record_span(self, name: str, elapsed_time: float) -> None:
+        """..."""
+
+        with self._lock:
+            stats = self.spans.get(name, SpanStats())
+            self.spans[name] = stats._replace(
+                count=stats.count + 1,
+                total_time=stats.total_time + elapsed_time,
+                max_time=max(stats.max_time, elapsed_time),
+            )
+
+    def merge(self, other: "Instrumentation") -> None:
+        """Add the specified 'other' instrumentation, e.g. as recorded by a
+        worker process, into this one."""
+
+        with self._lock:
+            self.counters.update(other.counters)
+
+            for name, histogram in other.histograms.items():
+                self.histograms.setdefault(name, Histogram()).merge(histogram)
+
+            for name, other_stats in other.spans.items():
+                stats = self.spans.get(name, SpanStats())
+                self.spans[name] = stats._replace(
+                    count=stats.count + other_stats.count,
+                    total_time=stats.total_time + other_stats.total_time,
+                    max_time=max(stats.max_time, other_stats.max_time),
+                )
+
+    def as_dict(self) -> Dict[str, Any]:
+        """..."""
+
+        return {
+            "counters": dict(sorted(self.counters.items())),
+            "histograms": {
+                name: histogram.as_dict()
+                for name, histogram in sorted(self.histograms.items())
+            },
+            "spans": {
+                name: stats._asdict() for name, stats in sorted(self.spans.items())
+            },
+        }
+
+
+def format_instrumentation(instrumentation: Instrumentation) -> str:
+    """..."""
+
+    lines = ["Counters:"]
+    for name, count in sorted(instrumentation.counters.items()):
+        lines.append(f"  {name}: {count}")
+
+    lines.append("Histograms:")
+    for name, histogram in sorted(instrumentation.histograms.items()):
+        lines.append(
+            f"  {name}: n={histogram.count} min={histogram.min} "
+            f"mean={histogram.total / histogram.count:.1f} max={histogram.max}"
+        )
+
+    lines.append("Spans:")
+    for name, stats in sorted(instrumentation.spans.items()):
+        lines.append(
+            f"  {name}: {stats.count} calls, {stats.total_time:.4f}s total, "
+            f"{stats.max_time:.4f}s max"
+        )
+
+    return "\n".join(lines)
+
+
+INSTRUMENTATION = Instrumentation(enabled=os.environ.get("AOC_INSTRUMENT", "0") == "1")
+
+
+EXECUTOR_BACKENDS = ("process", "thread", "serial")
+
+Task = TypeVar("Task")
+TaskResult = TypeVar("TaskResult")
+
+
+class TaskStats(NamedTuple):
+    num_calls: int = 0
+    num_tasks: int = 0
+    num_chunks: int = 0
+    task_time: float = 0.0
+    wall_time: float = 0.0
+
+
+def _run_chunk(
+    function_and_chunk: Tuple[Callable[[Task], TaskResult], List[Task], Optional[bool]]
+) -> Tuple[List[TaskResult], float, Optional[Instrumentation]]:
+    """Return the result of applying the function to each task of the chunk,
+    and the time taken to do so, as measured in the worker.  A worker process
+    is told whether to collect instrumentation for the chunk, and if so also
+    returns what the chunk recorded, so that it can be merged into the
+    instrumentation of the calling process.  A chunk run in the calling
+    process (told 'None') records into its instrumentation directly."""
+
+    function, chunk, collect_instrumentation = function_and_chunk
+
+    if collect_instrumentation is not None:
+        INSTRUMENTATION.enabled = collect_instrumentation
+        INSTRUMENTATION.reset()
+
+    try:
+        start_time_in_seconds = time.perf_counter()
+        results = [function(task) for task in chunk]
+        end_time_in_seconds = time.perf_counter()
+    finally:
+        # A worker process inherits 'enabled' from the process that forked it,
+        # and is otherwise left with the setting of its last chunk, so it is
+        # disabled between chunks rather than counting for uninstrumented ones.
+        if collect_instrumentation is not None:
+            INSTRUMENTATION.enabled = False
+
+    return (
+        results,
+        end_time_in_seconds - start_time_in_seconds,
+        INSTRUMENTATION if collect_instrumentation else None,
+    )
+
+
+class Executor:
+    """A pool of workers that is created on first use and shared by every
+    caller in the process, so that the startup of the pool is paid once
+    rather than on every call.  The 'backend' is one of 'EXECUTOR_BACKENDS';
+    the 'serial' backend runs every task in the calling thread, which keeps
+    the work visible to '--profile'.  Tasks are sent to workers in chunks,
+    sized from the mean time of earlier tasks of the same function, so that
+    cheap tasks are batched and expensive tasks are spread evenly."""
+
+    # The time that a chunk of cheap tasks should take, amortising the cost of
+    # sending the chunk to a worker.
+    TARGET_CHUNK_TIME = 0.01
+
+    # The minimum number of chunks per worker, for load balancing.
+    CHUNKS_PER_WORKER = 4
+
+    def __init__(self, *, backend: str, num_workers: int) -> None:
+        """..."""
+
+        self._pool: Optional[multiprocessing.pool.Pool] = None
+        self._pool_pid: Optional[int] = None
+
+        self.configure(backend=backend, num_workers=num_workers)
+        self.stats: Dict[str, TaskStats] = {}
+
+    def configure(self, *, backend: str, num_workers: int) -> None:
+        """Use the specified 'backend' and 'num_workers' from now on, shutting
+        down the current pool if there is one."""
+
+        assert (
+            backend in EXECUTOR_BACKENDS
+        ), f"Backend ({backend}) must be one of {EXECUTOR_BACKENDS}"
+        assert num_workers > 0, f"Number of workers ({num_workers}) must be positive"
+
+        self.shutdown()
+
+        self.backend = backend
+        self.num_workers = num_workers
+
+    def pool(self) -> Optional[multiprocessing.pool.Pool]:
+        """Return the shared pool, creating it if needed, or 'None' if tasks
+        should run in the calling thread."""
+
+        # Workers of a process pool are daemonic, so cannot start pools of
+        # their own, and run any nested work serially instead.
+        if self.backend == "serial" or multiprocessing.current_process().daemon:
+            return None
+
+        # A pool inherited across a fork belongs to the parent process.
+        if self._pool is not None and self._pool_pid != os.getpid():
+            self._pool = None
+
+        if self._pool is None:
+            if self.backend == "process":
+                self._pool = multiprocessing.Pool(self.num_workers)
+            else:
+                self._pool = multiprocessing.pool.ThreadPool(self.num_workers)
+
+            self._pool_pid = os.getpid()
+            atexit.register(self.shutdown)
+
+        return self._pool
+
+    def concurrent_executor(self) -> Optional[concurrent.futures.Executor]:
+        """Return a new 'concurrent.futures' executor with the backend and the
+        number of workers of this executor, or 'None' if tasks should run in
+        the calling thread.  Unlike the shared pool, whose tasks are lost if
+        their worker dies, a process executor then fails every pending task
+        with 'BrokenProcessPool'."""
+
+        if self.backend == "serial" or multiprocessing.current_process().daemon:
+            return None
+
+        if self.backend == "process":
+            return concurrent.futures.ProcessPoolExecutor(self.num_workers)
+
+        return concurrent.futures.ThreadPoolExecutor(self.num_workers)
+
+    def chunk_size(self, function: Callable, num_tasks: int) -> int:
+        """..."""
+
+        balanced_size = -(-num_tasks // (self.num_workers * self.CHUNKS_PER_WORKER))
+
+        stats = self.stats.get(function_name(function))
+        if stats is None or stats.task_time == 0:
+            return max(1, balanced_size)
+
+        mean_task_time = stats.task_time / stats.num_tasks
+        target_size = round(self.TARGET_CHUNK_TIME / mean_task_time)
+
+        return max(1, min(balanced_size, target_size))
+
+    def map(
+        self, function: Callable[[Task], TaskResult], tasks: Iterable[Task]
+    ) -> List[TaskResult]:
+        """Return the result of applying the specified 'function' to each of
+        the specified 'tasks', in order.  'function' and 'tasks' must be
+        picklable for the 'process' backend."""
+
+        tasks = list(tasks)
+
+        start_time_in_seconds = time.perf_counter()
+
+        pool = self.pool()
+        if pool is None:
+            chunks = [(function, tasks, None)]
+            chunk_results = list(map(_run_chunk, chunks))
+        else:
+            # Threads record into the shared instrumentation directly, whereas
+            # worker processes send back what they recorded.
+            collect_instrumentation = (
+                INSTRUMENTATION.enabled if self.backend == "process" else None
+            )
+
+            size = self.chunk_size(function, len(tasks))
+            chunks = [
+                (function, tasks[idx : idx + size], collect_instrumentation)
+                for idx in range(0, len(tasks), size)
+            ]
+            chunk_results = pool.map(_run_chunk, chunks, chunksize=1)
+
+            for _, _, instrumentation in chunk_results:
+                if instrumentation is not None:
+                    INSTRUMENTATION.merge(instrumentation)
+
+        end_time_in_seconds = time.perf_counter()
+
+        task_time = sum(elapsed for _, elapsed, _ in chunk_results)
+
+        name = function_name(function)
+        stats = self.stats.get(name, TaskStats())
+        self.stats[name] = stats._replace(
+            num_calls=stats.num_calls + 1,
+            num_tasks=stats.num_tasks + len(tasks),
+            num_chunks=stats.num_chunks + len(chunks),
+            task_time=stats.task_time + task_time,
+            wall_time=stats.wall_time + end_time_in_seconds - start_time_in_seconds,
+        )
+
+        return [result for results, _, _ in chunk_results for result in results]
+
+    def shutdown(self) -> None:
+        """..."""
+
+        if self._pool is not None and self._pool_pid == os.getpid():
+            self._pool.close()
+            self._pool.join()
+
+        self._pool = None
+
+
+def function_name(function: Callable) -> str:
+    """Return the qualified name of the specified 'function', looking through
+    'functools.partial'."""
+
+    while isinstance(function, functools.partial):
+        function = function.func
+
+    return f"{function.__module__}.{function.__qualname__}"
+
+
+def format_executor_stats(executor: Executor) -> str:
+    """..."""
+
+    lines = [f"Executor ({executor.backend}, {executor.num_workers} workers):"]
+    for name, stats in sorted(executor.stats.items()):
+        lines.append(
+            f"  {name}: {stats.num_calls} calls, {stats.num_tasks} tasks in "
+            f"{stats.num_chunks} chunks, {stats.wall_time:.2f}s wall, "
+            f"{stats.task_time:.2f}s in tasks "
+            f"({stats.task_time / max(1, stats.num_tasks) * 1e3:.3f}ms per task)"
+        )
+
+    return "\n".join(lines)
+
+
+EXECUTOR = Executor(
+    backend=os.environ.get("AOC_EXECUTOR", "process"),
+    num_workers=int(os.environ.get("AOC_WORKERS", os.cpu_count() or 4)),
+)
+
+
+def cached_parser(parser: Callable[[Input], Parsed]) -> Callable[[Input], Parsed]:
+    """Decorate the specified 'parser', which parses a whole input, so that
+    its result is looked up in, and stored into, 'PARSE_CACHE' when the cache
+    is enabled.  The parsed value must be picklable."""
+
+    @functools.wraps(parser)
+    def parse(input: Input) -> Parsed:
+        if not PARSE_CACHE.enabled:
+            return parser(input)
+
+        path = PARSE_CACHE.path_for(parser, input)
+
+        found, parsed = PARSE_CACHE.load(path)
+        if not found:
+            parsed = parser(input)
+            PARSE_CACHE.store(path, parsed)
+
+        return parsed
+
+    return parse
+
+
+def accepts_input_stream(solution: Solution) -> Solution:
+    """Mark the specified 'solution' as accepting an 'InputStream' in place of
+    the decoded input, and return it."""
+
+    solution.accepts_input_stream = True
+    return solution
+
+
+def takes_input_stream(solution: Solution) -> bool:
+    """..."""
+
+    return getattr(solution, "accepts_input_stream", False)
+
+
+def load_input(solution: Solution, path: Path) -> Input:
+    """Return the input at the specified 'path', either as an 'InputStream' if
+    the specified 'solution' accepts one, or as the decoded text otherwise."""
+
+    if takes_input_stream(solution):
+        return InputStream.from_path(path)
+
+    return path.read_text()
+
+
+def read_chunk(source: Union[Path, bytes], start: int, stop: int) -> bytes:
+    """Return the bytes at '[start, stop)' of the specified 'source', as yielded
+    by 'InputStream.chunk_sources'."""
+
+    if isinstance(source, bytes):
+        return source[start:stop]
+
+    with open(source, "rb") as file:
+        file.seek(start)
+        return file.read(stop - start)
+
+
+def input_lines(input: Input) -> Iterable[Union[str, bytes]]:
+    """Return the lines of the specified 'input', as 'bytes' if 'input' is an
+    'InputStream', or as 'str' otherwise."""
+
+    if isinstance(input, InputStream):
+        return input.lines()
+
+    return input.splitlines()
+
+
+def resolve_input_path(day: int, input: str) -> Path:
+    """Return the path to the input file of the specified 'day', where the
+    specified 'input' is either one of 'INPUT_TYPES' or a path to a file."""
+
+    if input in INPUT_TYPES:
+        return DATA_DIR / input / f"day{day}.txt"
+
+    return Path(input)
+
+
+def timed_solution(solution: Solution, input: Input) -> Tuple[int, float]:
+    """Return the answer of the specified 'solution' on the specified 'input',
+    along with the elapsed time in seconds."""
+
+    start_time_in_seconds = time.perf_counter()
+    answer = solution(input)
+    end_time_in_seconds = time.perf_counter()
+
+    return answer, end_time_in_seconds - start_time_in_seconds
+
+
+def solve_input_file(solution_and_path: Tuple[Solution, Path]) -> Dict[str, Any]:
+    """Return the result of running the solution on the input file, as a JSON
+    serialisable dictionary.  Failures are reported in the result rather than
+    raised, so that one bad input does not stop the rest of a directory."""
+
+    solution, path = solution_and_path
+
+    # Some solutions (e.g. day 13) render their answer to stdout, which is
+    # captured so that it does not interleave with the JSON lines.
+    output = io.StringIO()
+
+    try:
+        input = load_input(solution, path)
+        with contextlib.redirect_stdout(output):
+            answer, elapsed_time = timed_solution(solution, input)
+    except Exception as error:
+        return {
+            "input": str(path),
+            "answer": None,
+            "elapsed_time": None,
+            "error": f"{type(error).__name__}: {error}",
+            "output": output.getvalue(),
+        }
+
+    return {
+        "input": str(path),
+        "answer": answer if answer is None or type(answer) is int else str(answer),
+        "elapsed_time": elapsed_time,
+        "error": None,
+        "output": output.getvalue(),
+    }
+
+
+def input_failure(path: Path, error: BaseException) -> Dict[str, Any]:
+    """Return the result of a run on the input file at the specified 'path'
+    that failed with the specified 'error', as for 'solve_input_file'."""
+
+    return {
+        "input": str(path),
+        "answer": None,
+        "elapsed_time": None,
+        "error": f"{type(error).__name__}: {error}",
+        "output": "",
+    }
+
+
+def solve_input_files(
+    solution: Solution, paths: Iterable[Path], *, max_in_flight: int
+) -> Generator[Dict[str, Any], None, None]:
+    """Yield the result of the specified 'solution' on each of the specified
+    'paths', in order of completion, using workers configured as 'EXECUTOR'.
+    At most 'max_in_flight' files are submitted but not yet yielded at any
+    time, so that memory stays flat however many files there are.  If a
+    worker process dies (e.g. killed for running out of memory), the files in
+    flight are reported as failed, and the rest run in a new pool."""
+
+    executor = EXECUTOR.concurrent_executor()
+    if executor is None:
+        yield from (solve_input_file((solution, path)) for path in paths)
+        return
+
+    in_flight: Dict[concurrent.futures.Future, Path] = {}
+
+    def drain(max_remaining: int) -> Generator[Dict[str, Any], None, None]:
+        while len(in_flight) > max_remaining:
+            done, _ = concurrent.futures.wait(
+                in_flight, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                path = in_flight.pop(future)
+                error = future.exception()
+                yield future.result() if error is None else input_failure(path, error)
+
+    try:
+        for path in paths:
+            yield from drain(max_in_flight - 1)
+
+            try:
+                future = executor.submit(solve_input_file, (solution, path))
+            except concurrent.futures.BrokenExecutor:
+                # Every file in flight in the broken pool has failed with it.
+                yield from drain(0)
+                executor.shutdown()
+                executor = EXECUTOR.concurrent_executor()
+                future = executor.submit(solve_input_file, (solution, path))
+
+            in_flight[future] = path
+
+        yield from drain(0)
+    finally:
+        executor.shutdown()
+
+
+def format_answer(part: int, answer: int, elapsed_time: float) -> str:
+    """..."""
+
+    return f"({elapsed_time:.2f}s) Part {part}: {answer}"
+
+
+def format_cached_answer(part: int, answer: int) -> str:
+    """Return the line of an answer from the answer store, which is marked as
+    cached in place of a time, so that it cannot be mistaken for a solve."""
+
+    return f"(cached) Part {part}: {answer}"
+
+
+def format_timings(timings: List[float]) -> str:
+    """..."""
+
+    return (
+        f"({len(timings)} runs) min={min(timings):.4f}s "
+        f"median={statistics.median(timings):.4f}s max={max(timings):.4f}s"
+    )
+
+
+def collapse_stacks(stats: pstats.Stats) -> Dict[str, float]:
+    """Return the collapsed stacks ('outer;...;inner' mapped to seconds) of the
+    specified profiler 'stats', in the input format of 'flamegraph.pl'.
+
+    'cProfile' only records caller-callee pairs, not full stacks, so the time
+    of each function is apportioned to its callers in proportion to the time
+    each caller spent in it.  Recursive calls are folded into the outermost
+    frame of that function."""
+
+    callees: Dict[tuple, Dict[tuple, float]] = {}
+    roots = []
+
+    for function, (_, _, _, _, callers) in stats.stats.items():
+        callees.setdefault(function, {})
+        if not callers:
+            roots.append(function)
+
+        for caller, (_, _, _, cumulative_time) in callers.items():
+            callees.setdefault(caller, {})[function] = cumulative_time
+
+    def label(function: tuple) -> str:
+        filename, line, name = function
+        return f"{name} ({Path(filename).name}:{line})" if line else name
+
+    collapsed: Dict[str, float] = {}
+
+    def visit(function: tuple, path: List[tuple], allotted_time: float) -> None:
+        _, _, self_time, cumulative_time, _ = stats.stats[function]
+        if cumulative_time <= 0:
+            return
+
+        path.append(function)
+        fraction = allotted_time / cumulative_time
+
+        stack = ";".join(map(label, path))
+        collapsed[stack] = collapsed.get(stack, 0.0) + self_time * fraction
+
+        for callee, time_in_callee in callees[function].items():
+            if callee not in path:
+                visit(callee, path, time_in_callee * fraction)
+
+        path.pop()
+
+    for root in roots:
+        visit(root, [], stats.stats[root][3])
+
+    return collapsed
+
+
+def report_profile(
+    profiler: cProfile.Profile,
+    *,
+    profile_out: Optional[Path],
+    flamegraph_out: Optional[Path],
+    limit: int = 20,
+) -> None:
+    """..."""
+
+    stats = pstats.Stats(profiler, stream=sys.stdout)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(limit)
+
+    if profile_out is not None:
+        stats.dump_stats(profile_out)
+
+    if flamegraph_out is not None:
+        collapsed = collapse_stacks(stats)
+        flamegraph_out.write_text(
+            "".join(
+                f"{stack} {round(seconds * 1e6)}\n"
+                for stack, seconds in sorted(collapsed.items())
+                if round(seconds * 1e6) > 0
+            )
+        )
+
+
+class PeakMemorySampler(threading.Thread):
+    """Poll 'tracemalloc' in the background, keeping a snapshot taken close to
+    the peak of traced memory, so that the allocation sites responsible for
+    the peak can be reported after they have been freed."""
+
+    def __init__(self, *, interval: float = 0.05, growth: float = 1.1) -> None:
+        """..."""
+
+        super().__init__(daemon=True)
+
+        self.interval = interval
+        self.growth = growth
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self.snapshot_size = 0
+        self.peak = 0
+
+        self._stopped = threading.Event()
+
+    def sample(self) -> None:
+        """..."""
+
+        current, _ = tracemalloc.get_traced_memory()
+        if current > self.snapshot_size * self.growth:
+            self.snapshot = tracemalloc.take_snapshot()
+            self.snapshot_size = current
+
+    def start(self) -> None:
+        """Take the first sample straight away, rather than after 'interval',
+        and keep sampling in the background."""
+
+        self.sample()
+        super().start()
+
+    def run(self) -> None:
+        """..."""
+
+        while not self._stopped.wait(self.interval):
+            self.sample()
+
+    def stop(self) -> None:
+        """Stop sampling, and record the peak of traced memory so far."""
+
+        self._stopped.set()
+        self.join()
+        self.sample()
+
+        _, self.peak = tracemalloc.get_traced_memory()
+
+
+def report_memory(
+    sampler: PeakMemorySampler, *, limit: int = 10, min_fraction: float = 0.5
+) -> None:
+    """Print the peak of traced memory of the specified 'sampler', and the top
+    allocation sites of its snapshot, unless the snapshot holds less than the
+    specified 'min_fraction' of the peak, in which case its sites would be
+    those of the harness rather than of the solution."""
+
+    print(f"Peak traced memory: {sampler.peak / 2**20:.2f}MiB")
+
+    if sampler.snapshot is None:
+        return
+
+    if sampler.snapshot_size < sampler.peak * min_fraction:
+        print(
+            f"No allocation sites: the closest sample to the peak was at "
+            f"{sampler.snapshot_size / 2**20:.2f}MiB traced, as the peak lasted "
+            f"less than the sampling interval of {sampler.interval}s"
+        )
+        return
+
+    print(
+        f"Top allocation sites, at {sampler.snapshot_size / 2**20:.2f}MiB traced:"
+    )
+
+    # Leave out the frames of the harness, and of the sampler itself.
+    snapshot = sampler.snapshot.filter_traces(
+        [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, threading.__file__),
+            tracemalloc.Filter(False, __file__),
+        ]
+    )
+    for statistic in snapshot.statistics("lineno")[:limit]:
+        print(f"  {statistic}")
+
+
+def format_answer_store_stats(stats: Dict[str, int]) -> str:
+    """..."""
+
+    return (
+        f"Answer cache: {stats['hits']} hits, {stats['misses']} misses, "
+        f"{stats['entries']} entries ({stats['bytes']} bytes)"
+    )
+
+
+def run_solution_over_directory(
+    solution: Solution, parsed_args: CommandLineArgs
+) -> int:
+    """Run the specified 'solution' over every file in '--input-dir' matching
+    '--input-glob', printing one JSON line per file as it completes."""
+
+    paths = (
+        path
+        for path in sorted(parsed_args.input_dir.glob(parsed_args.input_glob))
+        if path.is_file()
+    )
+    max_in_flight = parsed_args.max_in_flight or 2 * EXECUTOR.num_workers
+
+    num_failures = 0
+    for result in solve_input_files(solution, paths, max_in_flight=max_in_flight):
+        print(json.dumps({"part": parsed_args.part, **result}), flush=True)
+        num_failures += result["error"] is not None
+
+    return 1 if num_failures else 0
 
 
 def run_solution(
     *,
-    part1: Callable[[str], int],
-    part2: Callable[[str], int]
+    part1: Solution,
+    part2: Solution
 ) -> int:
     """..."""
 
     parsed_args = parse_args(sys.argv[1:])
 
-    input = parsed_args.input.read_text()
+    if parsed_args.parse_cache:
+        PARSE_CACHE.enabled = True
+
+    if parsed_args.instrument or parsed_args.instrument_out:
+        INSTRUMENTATION.enabled = True
+
+    if parsed_args.executor is not None or parsed_args.workers is not None:
+        EXECUTOR.configure(
+            backend=parsed_args.executor or EXECUTOR.backend,
+            num_workers=parsed_args.workers or EXECUTOR.num_workers,
+        )
+
     solution = part1 if parsed_args.part == 1 else part2
-    
-    start_time_in_seconds = time.perf_counter()
-    answer = solution(input)
-    end_time_in_seconds = time.perf_counter()
-    
-    elapsed_time = end_time_in_seconds - start_time_in_seconds
-    print(f"({elapsed_time:.2f}s) Part {parsed_args.part}: {answer}")
 
-    return 0
\ No newline at end of file
+    if parsed_args.input_dir is not None:
+        return run_solution_over_directory(solution, parsed_args)
+
+    input = load_input(solution, parsed_args.input)
+
+    profiler = None
+    if parsed_args.profile or parsed_args.profile_out or parsed_args.flamegraph_out:
+        profiler = cProfile.Profile()
+
+    # Diagnostic runs always execute the solution.
+    use_answer_store = not (
+        parsed_args.no_cache
+        or parsed_args.repeat > 1
+        or profiler is not None
+        or parsed_args.trace_memory
+        or INSTRUMENTATION.enabled
+    )
+
+    if use_answer_store:
+        key = answer_key(solution, parsed_args.part, input)
+        stored_answer = ANSWER_STORE.lookup(key)
+
+        if stored_answer is not None:
+            print(format_cached_answer(parsed_args.part, int(stored_answer)))
+
+            if parsed_args.cache_stats:
+                print(format_answer_store_stats(ANSWER_STORE.stats()))
+
+            return 0
+
+    if parsed_args.trace_memory:
+        tracemalloc.start()
+        sampler = PeakMemorySampler()
+        sampler.start()
+
+    timings = []
+    for _ in range(parsed_args.repeat):
+        if profiler is not None:
+            profiler.enable()
+
+        answer, elapsed_time = timed_solution(solution, input)
+
+        if profiler is not None:
+            profiler.disable()
+
+        timings.append(elapsed_time)
+
+    # Stop tracing before any reporting, so that the peak and the allocation
+    # sites are those of the solution rather than of e.g. the profile report.
+    if parsed_args.trace_memory:
+        sampler.stop()
+        tracemalloc.stop()
+
+    print(format_answer(parsed_args.part, answer, timings[0]))
+
+    # Only integer answers are stored; other answers (e.g. day 13's rendered
+    # code) are a side effect of running the solution.
+    if use_answer_store and type(answer) is int:
+        ANSWER_STORE.store(key, str(answer))
+
+    if parsed_args.cache_stats:
+        print(format_answer_store_stats(ANSWER_STORE.stats()))
+
+    if parsed_args.repeat > 1:
+        print(format_timings(timings))
+
+    if parsed_args.executor_stats:
+        print(format_executor_stats(EXECUTOR))
+
+    if parsed_args.instrument:
+        print(format_instrumentation(INSTRUMENTATION))
+
+    if parsed_args.instrument_out:
+        parsed_args.instrument_out.write_text(
+            json.dumps(INSTRUMENTATION.as_dict(), indent=2) + "\n"
+        )
+
+    if profiler is not None:
+        report_profile(
+            profiler,
+            profile_out=parsed_args.profile_out,
+            flamegraph_out=parsed_args.flamegraph_out,
+        )
+
+    if parsed_args.trace_memory:
+        report_memory(sampler)
+
+    return 0
+
+
+def parse_cache_args(args: List[str]) -> argparse.Namespace:
+    """..."""
+
+    parser = argparse.ArgumentParser(prog="python -m python.util")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    clear_cache_parser = subparsers.add_parser(
+        "clear-cache", help="remove cached parsed inputs and answers"
+    )
+    clear_cache_parser.add_argument("--parsed", action="store_true")
+    clear_cache_parser.add_argument("--answers", action="store_true")
+
+    subparsers.add_parser("cache-stats", help="print answer cache counters")
+
+    return parser.parse_args(args)
+
+
+def main(args: List[str]) -> int:
+    """..."""
+
+    parsed_args = parse_cache_args(args)
+
+    if parsed_args.command == "clear-cache":
+        clear_all = not (parsed_args.parsed or parsed_args.answers)
+
+        if parsed_args.parsed or clear_all:
+            num_removed = PARSE_CACHE.clear()
+            print(
+                f"Removed {num_removed} parsed input(s) from {PARSE_CACHE.directory}"
+            )
+
+        if parsed_args.answers or clear_all:
+            num_removed = ANSWER_STORE.clear()
+            print(f"Removed {num_removed} answer(s) from {ANSWER_STORE.path}")
+
+    elif parsed_args.command == "cache-stats":
+        print(format_answer_store_stats(ANSWER_STORE.stats()))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
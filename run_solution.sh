@@ -47,6 +47,15 @@ function pythonSolution {
         error "Cannot find solution: $SOLUTION"
     fi
 
+    # Forward the request to a resident solver daemon ('python -m python.serve')
+    # if one is listening on $AOC_SOLVER_SOCKET, to skip the cost of starting
+    # an interpreter and importing the solution.
+    if [[ -S ${AOC_SOLVER_SOCKET:-} ]]; then
+        set -x
+        python3.8 -m python.client --socket $AOC_SOLVER_SOCKET --day $DAY --input $INPUT_FILE --part $PART
+        return
+    fi
+
     set -x
     python3.8 -m python.day$DAY --input $INPUT_FILE --part $PART
 }
@@ -66,6 +75,22 @@ function typescriptSolution {
     npm start -- $SOLUTION --input $INPUT_FILE --part $PART
 }
 
+#
+# Runs the solution in every language that has one, with compiled languages
+# built up front and warm repeats, and prints a table of their latency and
+# memory side by side.
+#
+# Arguments: as for the adapters above, but the solution directory is unused.
+#
+function compareSolutions {
+    DAY=$2
+    INPUT_FILE=$3
+    PART=$4
+
+    set -x
+    python3.8 -m python.compare --day $DAY --input $INPUT_FILE --part $PART ${AOC_COMPARE_ARGS:-}
+}
+
 
 ###############################################################################
 #                                     MAIN                                    #
@@ -130,7 +155,7 @@ fi
 
 # Sanity check for solutions directory.
 SOLUTION_DIR="$HERE/$LANGUAGE"
-if [[ ! -d $SOLUTION_DIR ]]; then
+if [[ $LANGUAGE != compare && ! -d $SOLUTION_DIR ]]; then
     error "Cannot find directory for language solutions: $SOLUTION_DIR"
 fi
 
@@ -145,6 +170,9 @@ case "$LANGUAGE" in
     typescript)
         RUN_SOLUTION=typescriptSolution
         ;;
+    compare)
+        RUN_SOLUTION=compareSolutions
+        ;;
     *)
         error "Unsupported language: $LANGUAGE" 
         ;;